@@ -0,0 +1,55 @@
+"""
+Bulk lookup throughput: thread pool vs. process pool.
+
+    python benchmarks/bulk_benchmark.py [--domains N] [--records N]
+
+Runs against a local stub server, so throughput is bound by response
+parsing rather than by the network.
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from dnslookupapi import BulkClient  # noqa: E402
+import stub_server  # noqa: E402
+
+
+def run(domains: list, **kwargs) -> float:
+    client = BulkClient(stub_server.API_KEY, base_url=stub_server.url(),
+                        **kwargs)
+    start = time.perf_counter()
+    failed = sum(1 for r in client.get(domains) if r.error is not None)
+    elapsed = time.perf_counter() - start
+    if failed:
+        print('  {} lookups failed'.format(failed))
+    return len(domains) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--domains', type=int, default=2000)
+    parser.add_argument('--records', type=int, default=120)
+    args = parser.parse_args()
+
+    server = stub_server.start(records=args.records)
+    domains = ['domain{}.com'.format(i) for i in range(args.domains)]
+
+    baseline = run(domains, processes=0, threads=8)
+    print('threads only       {:8.0f} lookups/s'.format(baseline))
+
+    processes = 1
+    while processes <= multiprocessing.cpu_count():
+        rate = run(domains, processes=processes, threads=4)
+        print('{:2d} processes       {:8.0f} lookups/s  (x{:.2f})'.format(
+            processes, rate, rate / baseline))
+        processes *= 2
+
+    server.terminate()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Concurrent lookups over HTTP/2 vs. the HTTP/1.1 connection pool.
+
+    python benchmarks/http2_benchmark.py [--domains N] [--threads N] [--delay S]
+
+Runs against local stand-in servers which answer after a fixed delay, like
+a remote API would, and count the connections opened by the client. Over
+HTTP/1.1 every lookup in flight takes a connection of the pool, over HTTP/2
+the lookups share one connection. Requires httpx
+with HTTP/2 support and h2.
+"""
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from dnslookupapi import Client  # noqa: E402
+import stub_server  # noqa: E402
+
+
+def run(url: str, domains: list, threads: int, connections,
+        **kwargs) -> tuple:
+    connections.value = 0
+    client = Client(stub_server.API_KEY, base_url=url, pool_size=threads,
+                    **kwargs)
+    # Warm up the connection pool, then measure
+    client.get('warmup.com')
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(client.get, domains))
+    elapsed = time.perf_counter() - start
+    client.close()
+    return len(domains) / elapsed, connections.value
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--domains', type=int, default=2000)
+    parser.add_argument('--records', type=int, default=20)
+    parser.add_argument('--delay', type=float, default=0.02)
+    parser.add_argument('--threads', type=int, nargs='+',
+                        default=[8, 32, 128])
+    args = parser.parse_args()
+
+    connections = multiprocessing.Value('i', 0)
+    http1 = stub_server.start(8765, args.records, args.delay,
+                              connections=connections)
+    http2 = stub_server.start(8766, args.records, args.delay, http2=True,
+                              connections=connections)
+    domains = ['domain{}.com'.format(i) for i in range(args.domains)]
+    try:
+        for threads in args.threads:
+            rate1, conns1 = run(stub_server.url(8765), domains, threads,
+                                connections)
+            rate2, conns2 = run(stub_server.url(8766), domains, threads,
+                                connections, transport='http2')
+            print('{:4d} threads  http1 {:6.0f} lookups/s {:4d} connections  '
+                  'http2 {:6.0f} lookups/s {:4d} connections'.format(
+                      threads, rate1, conns1, rate2, conns2))
+    finally:
+        http1.terminate()
+        http2.terminate()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Size and speed of the `Response` binary encoding compared to pickle and JSON.
+
+    python benchmarks/serialization_benchmark.py [--records N]
+
+"generic pickle" pickles the models with their full `__dict__`s, which is
+what pickling `BaseModel` instances cost before they had `__reduce__`.
+"""
+import argparse
+import copyreg
+import io
+from json import dumps, loads
+import os
+import pickle
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from dnslookupapi import Response, DnsRecord, DnsSoaRecord, \
+    DnsMxRecord, DnsCaaRecord  # noqa: E402
+import stub_server  # noqa: E402
+
+
+def _reduce_generic(obj):
+    return copyreg.__newobj__, (type(obj),), obj.__dict__
+
+
+def generic_dumps(obj, protocol: int) -> bytes:
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol)
+    pickler.dispatch_table = copyreg.dispatch_table.copy()
+    for cls in (Response, DnsRecord, DnsSoaRecord, DnsMxRecord, DnsCaaRecord):
+        pickler.dispatch_table[cls] = _reduce_generic
+    pickler.dump(obj)
+    return buffer.getvalue()
+
+
+def measure(name: str, dump, load, number: int):
+    data = dump()
+    dump_time = timeit.timeit(dump, number=number) / number
+    load_time = timeit.timeit(lambda: load(data), number=number) / number
+    print('{:16s} {:8d} bytes  dump {:8.1f} us  load {:8.1f} us'.format(
+        name, len(data), dump_time * 1e6, load_time * 1e6))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=120)
+    parser.add_argument('--number', type=int, default=500)
+    args = parser.parse_args()
+
+    values = stub_server.make_dns_data('example.com', args.records)
+    # Records are parsed twice, as they were before `records_by_type`
+    # shared them with `dns_records`
+    response = Response(values)
+    duplicated = Response(values)
+    duplicated.records_by_type = Response(values).records_by_type
+    protocol = pickle.HIGHEST_PROTOCOL
+
+    measure('to_bytes', response.to_bytes, Response.from_bytes, args.number)
+    measure('pickle', lambda: pickle.dumps(response, protocol),
+            pickle.loads, args.number)
+    measure('generic pickle', lambda: generic_dumps(duplicated, protocol),
+            pickle.loads, args.number)
+    measure('json', lambda: dumps(values).encode('UTF-8'),
+            lambda data: Response(loads(data)), args.number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Cold start cost: import time and latency of the first lookup.
+
+    python benchmarks/startup_benchmark.py [--runs N]
+
+Every measurement runs in a fresh interpreter. `import *` loads every
+public name, as the package did before names were loaded on first access.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+import stub_server
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+SNIPPETS = [
+    ('import dnslookupapi', 'import dnslookupapi'),
+    ('from dnslookupapi import *', 'from dnslookupapi import *'),
+    ('first lookup',
+     'import dnslookupapi\n'
+     'c = dnslookupapi.Client({key!r}, base_url={url!r})\n'
+     'c.get("example.com")'),
+]
+
+TIMER = (
+    'import time\n'
+    '_start = time.perf_counter()\n'
+    '{code}\n'
+    'print(time.perf_counter() - _start)\n'
+)
+
+
+def measure(code: str, runs: int) -> float:
+    env = dict(os.environ, PYTHONPATH=SRC)
+    times = []
+    for _ in range(runs):
+        out = subprocess.check_output(
+            [sys.executable, '-c', TIMER.format(code=code)], env=env)
+        times.append(float(out))
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    server = stub_server.start()
+    try:
+        for name, code in SNIPPETS:
+            code = code.format(key=stub_server.API_KEY, url=stub_server.url())
+            print('{:28s} {:8.1f} ms'.format(
+                name, measure(code, args.runs) * 1000))
+    finally:
+        server.terminate()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+"""
+Local stand-in for the DNS Lookup API used by the benchmarks.
+
+Serves one canned `_all` response for every domain over HTTP/1.1 with
+keep-alive, so that the numbers reflect the client rather than the network.
+With `http2` the response is served over HTTP/2 without TLS (h2c) instead,
+this requires h2. `delay` adds a fixed latency to every response.
+"""
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from json import dumps
+import multiprocessing
+import os
+import socketserver
+import sys
+import time
+from urllib.parse import urlparse, parse_qs
+
+API_KEY = 'at_' + '0' * 29
+
+
+def make_dns_data(domain: str, records: int = 120) -> dict:
+    templates = [
+        {'type': 1, 'dnsType': 'A', 'address': '142.250.68.{}'},
+        {'type': 28, 'dnsType': 'AAAA', 'address': '2607:f8b0:4007:811::{}'},
+        {'type': 2, 'dnsType': 'NS', 'target': 'ns{}.example-dns.net.'},
+        {'type': 15, 'dnsType': 'MX', 'target': 'mx{}.example-mail.net.',
+         'priority': 10},
+        {'type': 16, 'dnsType': 'TXT', 'strings': ['v=spf1 include:{} -all']},
+        {'type': 257, 'dnsType': 'CAA', 'value': 'ca{}.example.org',
+         'flags': 0, 'tag': 'issue'},
+    ]
+    dns_records = []
+    for i in range(records):
+        template = templates[i % len(templates)]
+        record = {k: v for k, v in template.items()}
+        for key in ('address', 'target', 'value'):
+            if key in record:
+                record[key] = record[key].format(i % 250)
+        if 'strings' in record:
+            record['strings'] = [record['strings'][0].format(i)]
+        record.update({
+            'name': domain + '.',
+            'ttl': 300,
+            'rRsetType': record['type'],
+            'rawText': '{}.\t\t300\tIN\t{}\t...'.format(
+                domain, record['dnsType']),
+        })
+        dns_records.append(record)
+
+    dns_records.append({
+        'type': 6, 'dnsType': 'SOA', 'name': domain + '.', 'ttl': 60,
+        'rRsetType': 6, 'rawText': '{}.\t\t60\tIN\tSOA\t...'.format(domain),
+        'admin': 'dns-admin.' + domain + '.', 'host': 'ns1.' + domain + '.',
+        'expire': 1800, 'minimum': 60, 'refresh': 900, 'retry': 900,
+        'serial': 404480356,
+    })
+    return {
+        'domainName': domain,
+        'types': [-1],
+        'dnsTypes': '_all',
+        'dnsRecords': dns_records,
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, avoid delayed ACK stalls
+    disable_nagle_algorithm = True
+    template = b''
+    delay = 0.0
+    connections = None
+
+    def setup(self):
+        super().setup()
+        _count(self.connections)
+
+    def do_GET(self):
+        status, headers, body = _respond(self.path, '')
+        if self.delay:
+            time.sleep(self.delay)
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(socketserver.ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    # Lets many pooled connections be opened at once
+    request_queue_size = 1024
+
+
+def _count(connections):
+    if connections is not None:
+        with connections.get_lock():
+            connections.value += 1
+
+
+def _respond(path: str, accept_encoding: str) -> tuple:
+    query = parse_qs(urlparse(path).query)
+    domain = query.get('domainName', ['example.com'])[0]
+    body = _Handler.template.replace(b'example.com', domain.encode('UTF-8'))
+    return 200, [('Content-Type', 'application/json'),
+                 ('Content-Length', str(len(body)))], body
+
+
+def _serve(port: int, records: int, ready, delay: float, http2: bool,
+           connections):
+    _Handler.template = dumps(
+        {'DNSData': make_dns_data('example.com', records)}).encode('UTF-8')
+    _Handler.delay = delay
+    _Handler.connections = connections
+    if http2:
+        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+        from tests.api_stub import H2Server
+
+        class _CountingH2Server(H2Server):
+            def _protocol(self):
+                _count(connections)
+                return super()._protocol()
+
+        server = _CountingH2Server(_respond, delay, port)
+    else:
+        server = _Server(('127.0.0.1', port), _Handler)
+    ready.set()
+    server.serve_forever()
+
+
+def start(port: int = 8765, records: int = 120, delay: float = 0.0,
+          http2: bool = False, connections=None) -> multiprocessing.Process:
+    """
+    Start the stub server in a child process and wait until it listens.
+
+    `connections`, a `multiprocessing.Value`, counts accepted connections.
+    """
+    ready = multiprocessing.Event()
+    process = multiprocessing.Process(
+        target=_serve, args=(port, records, ready, delay, http2, connections),
+        daemon=True)
+    process.start()
+    ready.wait(10)
+    return process
+
+
+def url(port: int = 8765) -> str:
+    return 'http://127.0.0.1:{}/DNSService'.format(port)
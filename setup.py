@@ -73,6 +73,9 @@ setup(
         'dev': [
             'tox',
             'flake8',
-        ]
+        ],
+        'http2': [
+            'httpx[http2]',
+        ],
     }
 )
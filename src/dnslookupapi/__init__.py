@@ -1,11 +1,66 @@
 __all__ = ['Client', 'ErrorMessage', 'DnsLookupApiError', 'ApiAuthError',
            'HttpApiError', 'EmptyApiKeyError', 'ParameterError',
            'ResponseError', 'BadRequestError', 'UnparsableApiResponseError',
-           'ApiRequester', 'Response', 'DnsRecord', 'DnsCaaRecord', 'DnsMxRecord', 'DnsSoaRecord']
-
-from .client import Client
-from .net.http import ApiRequester
-from .models.response import ErrorMessage, Response, DnsRecord, DnsCaaRecord, DnsMxRecord, DnsSoaRecord
-from .exceptions.error import DnsLookupApiError, ParameterError, \
-    EmptyApiKeyError, ResponseError, UnparsableApiResponseError, \
-    ApiAuthError, BadRequestError, HttpApiError
+           'ApiRequester', 'Http2ApiRequester', 'Response', 'DnsRecord', 'DnsCaaRecord', 'DnsMxRecord', 'DnsSoaRecord',
+           'BulkClient', 'BulkResult', 'BulkJob', 'JobStats',
+           'ResponseIndex', 'AimdLimiter', 'LimitDecision',
+           'HedgingPolicy']
+
+import sys
+
+# Submodules are imported on first access to their names, so that
+# `import dnslookupapi` does not load the HTTP transport or the bulk tools.
+_lazy = {
+    'Client': '.client',
+    'BulkClient': '.bulk',
+    'BulkResult': '.bulk',
+    'BulkJob': '.job',
+    'JobStats': '.job',
+    'ResponseIndex': '.index',
+    'AimdLimiter': '.concurrency',
+    'LimitDecision': '.concurrency',
+    'ApiRequester': '.net.http',
+    'Http2ApiRequester': '.net.http2',
+    'HedgingPolicy': '.net.hedging',
+    'ErrorMessage': '.models.response',
+    'Response': '.models.response',
+    'DnsRecord': '.models.response',
+    'DnsCaaRecord': '.models.response',
+    'DnsMxRecord': '.models.response',
+    'DnsSoaRecord': '.models.response',
+    'DnsLookupApiError': '.exceptions.error',
+    'ParameterError': '.exceptions.error',
+    'EmptyApiKeyError': '.exceptions.error',
+    'ResponseError': '.exceptions.error',
+    'UnparsableApiResponseError': '.exceptions.error',
+    'ApiAuthError': '.exceptions.error',
+    'BadRequestError': '.exceptions.error',
+    'HttpApiError': '.exceptions.error',
+}
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ is not supported
+    from .client import Client
+    from .bulk import BulkClient, BulkResult
+    from .job import BulkJob, JobStats
+    from .index import ResponseIndex
+    from .concurrency import AimdLimiter, LimitDecision
+    from .net.http import ApiRequester
+    from .net.http2 import Http2ApiRequester
+    from .net.hedging import HedgingPolicy
+    from .models.response import ErrorMessage, Response, DnsRecord, DnsCaaRecord, DnsMxRecord, DnsSoaRecord
+    from .exceptions.error import DnsLookupApiError, ParameterError, \
+        EmptyApiKeyError, ResponseError, UnparsableApiResponseError, \
+        ApiAuthError, BadRequestError, HttpApiError
+else:
+    def __getattr__(name):
+        if name in _lazy:
+            from importlib import import_module
+            value = getattr(import_module(_lazy[name], __name__), name)
+            globals()[name] = value
+            return value
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name))
+
+    def __dir__():
+        return sorted(list(globals()) + __all__)
@@ -0,0 +1,216 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+import multiprocessing
+import time
+import typing
+
+from .client import Client
+from .concurrency import AimdLimiter
+from .models.response import Response
+from .exceptions.error import HttpApiError
+
+
+class BulkResult(typing.NamedTuple):
+    domain: str
+    response: Response or None
+    error: Exception or None
+
+
+# Per-process client, created once by the pool initializer so every worker
+# keeps its own pool of keep-alive connections.
+_worker_client = None
+
+
+def _init_worker(api_key: str, client_kwargs: dict):
+    global _worker_client
+    _worker_client = Client(api_key, **client_kwargs)
+
+
+def _is_overload(error: Exception or None) -> bool:
+    # HTTP errors other than auth and bad request ones, connection errors
+    # and timeouts (requests exceptions are OSErrors, and the HTTP/2
+    # transport raises ConnectionError and TimeoutError)
+    return isinstance(error, (HttpApiError, OSError))
+
+
+def _lookup_one(client: Client, domain: str, rr_types: str,
+                limiter: AimdLimiter or None = None) -> tuple:
+    if limiter is not None:
+        limiter.acquire()
+    start = time.monotonic()
+    response, error = None, None
+    try:
+        response = client.get(domain, rr_types)
+    except Exception as e:
+        error = e
+    finally:
+        if limiter is not None:
+            limiter.release(time.monotonic() - start, _is_overload(error))
+    return domain, response, error
+
+
+def _lookup_all(client: Client, domains: list, rr_types: str,
+                executor: ThreadPoolExecutor or None) -> list:
+    if executor is None:
+        return [_lookup_one(client, d, rr_types) for d in domains]
+    return list(executor.map(
+        lambda d: _lookup_one(client, d, rr_types), domains))
+
+
+def _lookup_chunk(domains: list, rr_types: str, threads: int) -> list:
+    if threads <= 1:
+        return _lookup_all(_worker_client, domains, rr_types, None)
+    with ThreadPoolExecutor(threads) as executor:
+        return _lookup_all(_worker_client, domains, rr_types, executor)
+
+
+def _chunked(iterable: typing.Iterable, size: int) -> typing.Iterator[list]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class BulkClient:
+    """
+    Looks up many domains concurrently.
+
+    With `processes` > 0 the input is split into chunks which are sharded
+    across a process pool, so that parsing of API responses is not limited
+    by the GIL. Every worker process owns its own `Client` with a pooled
+    `ApiRequester`; parsed results are sent back to the parent process
+    in the compact binary encoding of `Response`.
+    With `processes` == 0 all lookups run on a thread pool in the calling
+    process.
+
+    In the thread pool, instead of a fixed number of threads, concurrency
+    can be controlled by an `AimdLimiter`, which adapts the number of
+    lookups in flight to the observed latency and errors.
+    """
+
+    _api_key: str
+    _client_kwargs: dict
+    _processes: int
+    _threads: int
+    _chunk_size: int
+    _limiter: AimdLimiter or None
+
+    def __init__(self, api_key: str, **kwargs):
+        """
+        :param api_key: str: Your API key.
+        :key processes: int: (optional) Number of worker processes.
+            Defaults to the number of CPUs, 0 disables the process pool
+        :key threads: int: (optional) Concurrent lookups per process
+        :key chunk_size: int: (optional) Domains sent to a worker process
+            at once. The thread pool takes domains one by one
+        :key limiter: AimdLimiter: (optional) Adaptive concurrency limit,
+            replaces `threads`. Requires `processes` == 0
+        :key base_url: str: (optional) API endpoint URL.
+        :key timeout: float: (optional) API call timeout in seconds
+        """
+        processes = kwargs.pop('processes', None)
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        threads = kwargs.pop('threads', 4)
+        chunk_size = kwargs.pop('chunk_size', 64)
+        limiter = kwargs.pop('limiter', None)
+
+        if int(processes) < 0:
+            raise ValueError("Number of processes should not be negative")
+        if int(threads) < 1 or int(chunk_size) < 1:
+            raise ValueError(
+                "Number of threads and chunk size should be positive")
+
+        if limiter is not None:
+            if not isinstance(limiter, AimdLimiter):
+                raise ValueError(
+                    "Limiter should be an instance of dnslookupapi.AimdLimiter")
+            if int(processes) > 0:
+                raise ValueError(
+                    "Adaptive concurrency requires processes=0")
+            threads = limiter.settings['max_limit']
+
+        kwargs.setdefault('pool_size', max(int(threads), 1))
+
+        # Validates the key and the client parameters before any work starts
+        Client(api_key, **kwargs).close()
+
+        self._api_key = api_key
+        self._client_kwargs = kwargs
+        self._processes = int(processes)
+        self._threads = int(threads)
+        self._chunk_size = int(chunk_size)
+        self._limiter = limiter
+
+    @property
+    def processes(self) -> int:
+        return self._processes
+
+    @property
+    def threads(self) -> int:
+        return self._threads
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    @property
+    def limiter(self) -> AimdLimiter or None:
+        return self._limiter
+
+    def get(self, domains: typing.Iterable[str],
+            rr_types: str = '_all') -> typing.Iterator[BulkResult]:
+        """
+        Look up every domain from `domains`.
+
+        Failed lookups do not stop the run, the error is returned in the
+        `error` field of the corresponding result instead.
+
+        :param domains: Iterable of domain names. Consumed lazily.
+        :param rr_types: Optional. String. See `Client.get`
+        :return: iterator of `BulkResult` in the order of `domains`
+        """
+        if self._processes == 0:
+            yield from self._get_threaded(domains, rr_types)
+        else:
+            yield from self._get_multiprocess(
+                _chunked(domains, self._chunk_size), rr_types)
+
+    def _get_threaded(self, domains: typing.Iterable[str],
+                      rr_types: str) -> typing.Iterator[BulkResult]:
+        client = Client(self._api_key, **self._client_kwargs)
+        window = self._threads * 2
+        pending = deque()
+        try:
+            with ThreadPoolExecutor(self._threads) as executor:
+                for domain in domains:
+                    pending.append(executor.submit(
+                        _lookup_one, client, domain, rr_types, self._limiter))
+                    if len(pending) >= window:
+                        yield BulkResult(*pending.popleft().result())
+                while pending:
+                    yield BulkResult(*pending.popleft().result())
+        finally:
+            client.close()
+
+    def _get_multiprocess(self, chunks: typing.Iterator[list],
+                          rr_types: str) -> typing.Iterator[BulkResult]:
+        # A bounded window of submitted chunks keeps the memory flat for
+        # large inputs while still giving every worker something to do.
+        window = self._processes * 2
+        pending = deque()
+        with multiprocessing.Pool(
+                self._processes, _init_worker,
+                (self._api_key, self._client_kwargs)) as pool:
+            for chunk in chunks:
+                pending.append(pool.apply_async(
+                    _lookup_chunk, (chunk, rr_types, self._threads)))
+                if len(pending) >= window:
+                    for item in pending.popleft().get():
+                        yield BulkResult(*item)
+            while pending:
+                for item in pending.popleft().get():
+                    yield BulkResult(*item)
@@ -0,0 +1,141 @@
+from collections import OrderedDict
+import logging
+import threading
+import time
+
+
+class CacheEntry:
+    __slots__ = ('value', 'stored_at', 'ttl')
+
+    def __init__(self, value, stored_at: float, ttl: float):
+        self.value = value
+        self.stored_at = stored_at
+        self.ttl = ttl
+
+    @property
+    def expires_at(self) -> float:
+        return self.stored_at + self.ttl
+
+
+class ResponseCache:
+    """
+    Thread-safe in-memory cache with expiration and LRU eviction.
+    """
+    _max_size: int
+    _ttl: float
+
+    def __init__(self, ttl: float, max_size: int = 10000, clock=time.monotonic):
+        """
+        :param ttl: Seconds an entry stays valid
+        :param max_size: Max number of entries, least recently used
+            entries are evicted first
+        :param clock: Monotonic time source
+        """
+        if ttl is None or ttl <= 0:
+            raise ValueError("Cache TTL should be positive")
+        if max_size is None or max_size < 1:
+            raise ValueError("Cache size should be a positive integer")
+
+        self._ttl = float(ttl)
+        self._max_size = int(max_size)
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def now(self) -> float:
+        return self._clock()
+
+    def get(self, key) -> CacheEntry or None:
+        """Valid entry for the key or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._clock() >= entry.expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, value, ttl: float = None):
+        with self._lock:
+            self._entries[key] = CacheEntry(
+                value, self._clock(), self._ttl if ttl is None else ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return None if entry is None else entry.value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class Refresher:
+    """
+    Runs background refreshes on a small bounded pool of threads.
+    At most one refresh per key is queued or running at any time.
+    """
+    __logger = logging.getLogger("refresher")
+
+    def __init__(self, workers: int = 2):
+        if workers is None or workers < 1:
+            raise ValueError("Number of refresh workers should be positive")
+        from concurrent.futures import ThreadPoolExecutor
+        self._executor = ThreadPoolExecutor(
+            int(workers), thread_name_prefix='dnslookupapi-refresh')
+        self._in_flight = set()
+        self._lock = threading.Lock()
+
+    def schedule(self, key, refresh) -> bool:
+        """
+        Call `refresh()` in background unless the key is already refreshing.
+
+        :return: True if a refresh was scheduled
+        """
+        with self._lock:
+            if key in self._in_flight:
+                return False
+            self._in_flight.add(key)
+        try:
+            self._executor.submit(self._run, key, refresh)
+        except RuntimeError:
+            # The pool is shut down
+            self._done(key)
+            return False
+        return True
+
+    def is_refreshing(self, key) -> bool:
+        with self._lock:
+            return key in self._in_flight
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait)
+
+    def _run(self, key, refresh):
+        try:
+            refresh()
+        except Exception as error:
+            Refresher.__logger.warning(
+                "Background refresh of %s failed: %s", key, error)
+        finally:
+            self._done(key)
+
+    def _done(self, key):
+        with self._lock:
+            self._in_flight.discard(key)
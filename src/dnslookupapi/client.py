@@ -1,11 +1,14 @@
+import copy
 import datetime
 from json import loads, JSONDecodeError
 import re
+import threading
 
+from .cache import ResponseCache, Refresher
 from .net.http import ApiRequester
 from .models.response import Response
 from .exceptions.error import ParameterError, EmptyApiKeyError, \
-    UnparsableApiResponseError, ResponseError, ApiAuthError
+    UnparsableApiResponseError, ResponseError, ApiAuthError, BadRequestError
 
 
 class Client:
@@ -13,6 +16,11 @@ class Client:
     _api_requester: ApiRequester or None
     _api_key: str
     _last_result: Response or None
+    _cache: ResponseCache or None
+    _refresher: Refresher or None
+    _refresh_ahead: float
+    _negative_cache: ResponseCache or None
+    _negative_ttl: dict
 
     _re_api_key = re.compile(r'^at_[a-z0-9]{29}$', re.IGNORECASE)
     _re_domain_name = re.compile(
@@ -25,6 +33,12 @@ class Client:
     JSON_FORMAT = 'json'
     XML_FORMAT = 'xml'
 
+    # Key of `negative_cache_ttl` for responses with no DNS records
+    EMPTY_RESULT = 'empty'
+    # Negative outcomes which are never cached: authorization, request
+    # and transport problems are not properties of the domain
+    _NEVER_CACHED = (ApiAuthError, BadRequestError)
+
     __DATETIME_OR_NONE_MSG = 'Value should be None or an instance of ' \
                              'datetime.date'
     _SUPPORTED_TYPES = {}
@@ -34,16 +48,69 @@ class Client:
         :param api_key: str: Your API key.
         :key base_url: str: (optional) API endpoint URL.
         :key timeout: float: (optional) API call timeout in seconds
+        :key pool_size: int: (optional) max keep-alive connections to the API
+        :key hedging: HedgingPolicy: (optional) Duplicate slow API calls
+        :key transport: str: (optional) 'http1' (default), or 'http2' to
+            multiplex concurrent calls over a few HTTP/2 connections.
+            'http2' requires httpx: pip install dns-lookup-api[http2]
+        :key cache_ttl: float: (optional) Seconds `get` results are cached
+            for. Caching is disabled by default
+        :key cache_size: int: (optional) Max number of cached results
+        :key refresh_ahead: float: (optional) Fraction of `cache_ttl` in (0, 1)
+            after which a cache hit also re-fetches the result in background
+        :key refresh_workers: int: (optional) Threads for background refreshes
+        :key negative_cache_ttl: dict: (optional) Seconds negative outcomes
+            are cached for, by kind: `ResponseError`,
+            `UnparsableApiResponseError` and `Client.EMPTY_RESULT` (no DNS
+            records). A subclass uses the TTL of its closest listed base.
+            Auth and transport errors are never cached
         """
 
         self._api_key = ''
+        self._last_result = None
+        self._cache = None
+        self._refresher = None
+        self._refresh_ahead = 0.0
+        self._negative_cache = None
+        self._negative_ttl = {}
+        self._negative_hits = {}
+        self._negative_stored = 0
+        self._stats_lock = threading.Lock()
 
         self.api_key = api_key
 
+        cache_ttl = kwargs.pop('cache_ttl', None)
+        cache_size = kwargs.pop('cache_size', 10000)
+        refresh_ahead = kwargs.pop('refresh_ahead', None)
+        refresh_workers = kwargs.pop('refresh_workers', 2)
+        negative_cache_ttl = kwargs.pop('negative_cache_ttl', None)
+        transport = kwargs.pop('transport', 'http1')
+
+        if cache_ttl is not None:
+            self._cache = ResponseCache(cache_ttl, cache_size)
+        if refresh_ahead is not None:
+            if self._cache is None:
+                raise ValueError("Refresh-ahead requires cache_ttl")
+            if not 0 < refresh_ahead < 1:
+                raise ValueError("Refresh-ahead value should be in (0, 1)")
+            self._refresh_ahead = float(refresh_ahead)
+            self._refresher = Refresher(refresh_workers)
+        if negative_cache_ttl:
+            self._negative_ttl = Client._validate_negative_ttl(
+                negative_cache_ttl)
+            self._negative_cache = ResponseCache(
+                max(self._negative_ttl.values()), cache_size)
+
         if 'base_url' not in kwargs:
             kwargs['base_url'] = Client.__default_url
 
-        self.api_requester = ApiRequester(**kwargs)
+        if transport == 'http1':
+            self.api_requester = ApiRequester(**kwargs)
+        elif transport == 'http2':
+            from .net.http2 import Http2ApiRequester
+            self.api_requester = Http2ApiRequester(**kwargs)
+        else:
+            raise ValueError("Transport should be 'http1' or 'http2'")
 
     @property
     def api_key(self) -> str:
@@ -72,6 +139,20 @@ class Client:
         else:
             self._api_requester.base_url = value
 
+    @property
+    def cache(self) -> ResponseCache or None:
+        return self._cache
+
+    @property
+    def negative_cache_stats(self) -> dict:
+        """
+        Negative cache counters: `stored` outcomes, and `hits` by kind,
+        which is the number of API calls saved by negative caching
+        """
+        with self._stats_lock:
+            return {'stored': self._negative_stored,
+                    'hits': dict(self._negative_hits)}
+
     @property
     def last_result(self) -> Response or None:
         return self._last_result
@@ -98,6 +179,12 @@ class Client:
         """
         Get parsed API response as a `Response` instance.
 
+        When caching is enabled, cached responses are returned while valid.
+        With refresh-ahead, a hit on an entry older than `refresh_ahead`
+        of its TTL also schedules a background re-fetch of the entry.
+        With negative caching, cached errors are raised again and cached
+        empty responses are returned without calling the API.
+
         :key domain: Required. The website's domain name.
         :key rr_types: Optional. String.
             A, NS, SOA, MX, etc. You can specify multiple comma-separated values,
@@ -113,6 +200,83 @@ class Client:
         :raises ParameterError: invalid parameter's value
         """
 
+        key = Client._cache_key(domain, rr_types)
+        response = None
+        if self._negative_cache is not None:
+            entry = self._negative_cache.get(key)
+            if entry is not None:
+                self._count_negative_hit(entry.value)
+                if isinstance(entry.value, Exception):
+                    # A fresh copy per hit, so that tracebacks do not pile
+                    # up on one shared exception object
+                    raise copy.copy(entry.value)
+                response = entry.value
+
+        if response is None and self._cache is not None:
+            entry = self._cache.get(key)
+            if entry is not None:
+                response = entry.value
+                if self._refresher is not None and \
+                        self._cache.now() - entry.stored_at >= self._refresh_ahead * entry.ttl:
+                    self._refresher.schedule(
+                        key, lambda: self._load(key, domain, rr_types))
+
+        if response is None:
+            response = self._load(key, domain, rr_types)
+
+        self.last_result = response
+        return response
+
+    def close(self):
+        """Stop background refreshes and release pooled connections"""
+        if self._refresher is not None:
+            self._refresher.shutdown()
+        self._api_requester.close()
+
+    def _load(self, key: tuple, domain: str, rr_types: str) -> Response:
+        """Fetch a response and put it into the matching cache"""
+        try:
+            response = self._fetch(domain, rr_types)
+        except (ResponseError, UnparsableApiResponseError) as error:
+            self._put_negative(
+                key, copy.copy(error).with_traceback(None), type(error))
+            raise
+
+        if not response.dns_records and \
+                self._put_negative(key, response, Client.EMPTY_RESULT):
+            return response
+        if self._cache is not None:
+            self._cache.put(key, response)
+        return response
+
+    def _put_negative(self, key: tuple, value, kind) -> bool:
+        if self._negative_cache is None:
+            return False
+        ttl = self._negative_ttl_for(kind)
+        if ttl is None:
+            return False
+        self._negative_cache.put(key, value, ttl)
+        with self._stats_lock:
+            self._negative_stored += 1
+        return True
+
+    def _negative_ttl_for(self, kind) -> float or None:
+        if kind == Client.EMPTY_RESULT:
+            return self._negative_ttl.get(kind)
+        if issubclass(kind, Client._NEVER_CACHED):
+            return None
+        for cls in kind.__mro__:
+            if cls in self._negative_ttl:
+                return self._negative_ttl[cls]
+        return None
+
+    def _count_negative_hit(self, value):
+        kind = type(value).__name__ if isinstance(value, Exception) \
+            else Client.EMPTY_RESULT
+        with self._stats_lock:
+            self._negative_hits[kind] = self._negative_hits.get(kind, 0) + 1
+
+    def _fetch(self, domain: str, rr_types: str) -> Response:
         response = self.get_raw(domain, rr_types, Client._PARSABLE_FORMAT)
         try:
             parsed = loads(str(response))
@@ -126,8 +290,7 @@ class Client:
                                     else 'Could not find the correct root element.')
 
             if 'domainName' in parsed['DNSData']:
-                self.last_result = Response(parsed['DNSData'])
-                return self.last_result
+                return Response(parsed['DNSData'])
             raise UnparsableApiResponseError(
                 "Could not find the correct root element.", None)
         except JSONDecodeError as error:
@@ -155,6 +318,40 @@ class Client:
         :raises ParameterError: invalid parameter's value
         """
 
+        return self._api_requester.get(
+            self._raw_payload(domain, rr_types, output_format))
+
+    def get_raw_bytes(self, domain: str, rr_types: str = '_all',
+                      output_format: str = _PARSABLE_FORMAT,
+                      sink=None, compressed: bool = False) -> bytes or int:
+        """
+        Get raw API response as bytes, or write it to a sink in chunks,
+        without decoding it to str. The transfer is gzip/deflate compressed.
+
+        :key domain: Required. The website's domain name.
+        :key rr_types: Optional. String. See `get_raw`
+        :key output_format: Optional.
+        Use Client.JSON_FORMAT and Client.XML_FORMAT
+            constants
+        :key sink: Optional. File-like object with a `write` method,
+            or a callable, which receives the response in chunks
+        :key compressed: Optional. Keep the response gzip compressed
+        :return: bytes if `sink` is None, otherwise the number of bytes
+            written to the sink
+        :raises ConnectionError:
+        :raises DnsLookupApiError: Base class for all errors below
+        :raises ApiAuthError: Server returned 401, 402 or 403 HTTP code
+        :raises BadRequestError: Server returned 400 or 422 HTTP code
+        :raises HttpApiError: HTTP code >= 300 and not equal to above codes
+        :raises ParameterError: invalid parameter's value
+        """
+
+        return self._api_requester.get_stream(
+            self._raw_payload(domain, rr_types, output_format),
+            sink, compressed)
+
+    def _raw_payload(self, domain: str, rr_types: str,
+                     output_format: str) -> dict:
         if self.api_key == '':
             raise EmptyApiKeyError('')
 
@@ -162,12 +359,34 @@ class Client:
         _rr_types = Client._validate_rr_types(rr_types)
         _output_format = Client._validate_output_format(output_format)
 
-        return self._api_requester.get(self._build_payload(
+        return self._build_payload(
             self.api_key,
             _domain,
             _rr_types,
             _output_format,
-        ))
+        )
+
+    @staticmethod
+    def _cache_key(domain: str, rr_types: str) -> tuple:
+        return str(domain).lower(), str(rr_types)
+
+    @staticmethod
+    def _validate_negative_ttl(value: dict) -> dict:
+        if not isinstance(value, dict):
+            raise ValueError("Negative cache TTL should be a dict")
+        result = {}
+        for kind, ttl in value.items():
+            if kind != Client.EMPTY_RESULT and not (
+                    isinstance(kind, type)
+                    and issubclass(kind, (ResponseError, UnparsableApiResponseError))
+                    and not issubclass(kind, Client._NEVER_CACHED)):
+                raise ValueError(
+                    "Only ResponseError, UnparsableApiResponseError and "
+                    "Client.EMPTY_RESULT outcomes can be cached")
+            if ttl is None or ttl <= 0:
+                raise ValueError("Negative cache TTL should be positive")
+            result[kind] = float(ttl)
+        return result
 
     @staticmethod
     def _validate_api_key(api_key) -> str:
@@ -0,0 +1,172 @@
+from collections import deque
+import logging
+import threading
+import time
+import typing
+
+
+class LimitDecision(typing.NamedTuple):
+    time: float
+    previous: int
+    limit: int
+    reason: str
+    p95: float
+    error_rate: float
+
+
+class AimdLimiter:
+    """
+    Adaptive limit of concurrent lookups (additive increase,
+    multiplicative decrease).
+
+    Lookups are measured in windows of `window` completions. After a window
+    with no errors and the p95 latency within `latency_tolerance` times the
+    best p95 seen so far, the limit grows by `increase` if it was reached
+    during the window. When a lookup fails with an overload error, or the
+    p95 latency of a window rises above the tolerance, the limit is
+    multiplied by `backoff`. After a cut the limit is not cut again until
+    as many lookups as the limit before the cut have completed, so that
+    lookups started before the cut do not count twice.
+    """
+    __logger = logging.getLogger("aimd-limiter")
+
+    _settings: dict
+
+    def __init__(self, **kwargs):
+        """
+        :key initial_limit: int: (optional) Starting limit
+        :key min_limit: int: (optional) Lowest limit
+        :key max_limit: int: (optional) Highest limit
+        :key increase: int: (optional) Additive increase step
+        :key backoff: float: (optional) Multiplicative decrease in (0, 1)
+        :key latency_tolerance: float: (optional) Allowed ratio of the
+            window p95 latency to the best p95 latency seen
+        :key window: int: (optional) Completions per measurement window
+        :key history: int: (optional) Number of decisions kept
+        """
+        self._settings = {
+            'initial_limit': int(kwargs.get('initial_limit', 4)),
+            'min_limit': int(kwargs.get('min_limit', 1)),
+            'max_limit': int(kwargs.get('max_limit', 64)),
+            'increase': int(kwargs.get('increase', 1)),
+            'backoff': float(kwargs.get('backoff', 0.5)),
+            'latency_tolerance': float(kwargs.get('latency_tolerance', 2.0)),
+            'window': int(kwargs.get('window', 20)),
+            'history': int(kwargs.get('history', 100)),
+        }
+        s = self._settings
+        if not 1 <= s['min_limit'] <= s['initial_limit'] <= s['max_limit']:
+            raise ValueError(
+                "Limits should satisfy 1 <= min <= initial <= max")
+        if not 0 < s['backoff'] < 1:
+            raise ValueError("Backoff value should be in (0, 1)")
+        if s['increase'] < 1 or s['window'] < 1 or s['latency_tolerance'] <= 1:
+            raise ValueError("Invalid increase, window or latency tolerance")
+
+        self._limit = s['initial_limit']
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._latencies = []
+        self._errors = 0
+        self._saturated = False
+        # Completions left before the limit may be cut again
+        self._cut_guard = 0
+        self._best_p95 = None
+        self._decisions = deque(maxlen=s['history'])
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def settings(self) -> dict:
+        return dict(self._settings)
+
+    @property
+    def decisions(self) -> typing.List[LimitDecision]:
+        """Most recent limit changes, oldest first"""
+        with self._condition:
+            return list(self._decisions)
+
+    def acquire(self):
+        """Block until a lookup may start"""
+        with self._condition:
+            while self._in_flight >= self._limit:
+                self._condition.wait()
+            self._in_flight += 1
+            if self._in_flight >= self._limit:
+                self._saturated = True
+
+    def release(self, latency: float, overload: bool = False):
+        """
+        Report a finished lookup.
+
+        :param latency: Duration of the lookup in seconds
+        :param overload: The lookup failed because the API or the network
+            is overloaded, e.g. `HttpApiError` or a timeout
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if self._cut_guard > 0:
+                self._cut_guard -= 1
+            self._latencies.append(latency)
+            if overload:
+                self._errors += 1
+                if self._cut_guard == 0:
+                    self._decrease('errors')
+            if len(self._latencies) >= self._settings['window']:
+                self._end_window()
+            self._condition.notify_all()
+
+    def _end_window(self):
+        p95 = self._p95()
+        tolerance = self._settings['latency_tolerance']
+        if self._best_p95 is None or p95 < self._best_p95:
+            self._best_p95 = p95
+
+        if self._errors:
+            if self._cut_guard == 0:
+                self._decrease('errors')
+        elif p95 > self._best_p95 * tolerance:
+            if self._cut_guard == 0:
+                self._decrease('latency')
+        elif self._saturated and self._limit < self._settings['max_limit']:
+            self._set_limit(
+                min(self._limit + self._settings['increase'],
+                    self._settings['max_limit']), 'increase')
+
+        self._latencies = []
+        self._errors = 0
+        self._saturated = self._in_flight >= self._limit
+
+    def _decrease(self, reason: str):
+        limit = max(int(self._limit * self._settings['backoff']),
+                    self._settings['min_limit'])
+        self._cut_guard = self._limit
+        if reason == 'latency':
+            # Let the baseline follow a lasting latency change
+            self._best_p95 = None
+        if limit != self._limit:
+            self._set_limit(limit, reason)
+
+    def _set_limit(self, limit: int, reason: str):
+        n = len(self._latencies)
+        decision = LimitDecision(
+            time.time(), self._limit, limit, reason,
+            self._p95(), self._errors / n if n else 0.0)
+        self._decisions.append(decision)
+        self._limit = limit
+        AimdLimiter.__logger.debug(
+            "Limit %d -> %d (%s, p95 %.3fs, error rate %.2f)",
+            decision.previous, decision.limit, reason,
+            decision.p95, decision.error_rate)
+
+    def _p95(self) -> float:
+        if not self._latencies:
+            return 0.0
+        latencies = sorted(self._latencies)
+        return latencies[int(0.95 * (len(latencies) - 1))]
@@ -1,5 +1,4 @@
 from json import loads
-from ..models.response import ErrorMessage
 
 
 class DnsLookupApiError(Exception):
@@ -31,6 +30,7 @@ class ResponseError(DnsLookupApiError):
         self.message = message
         self._parsed_message = None
         try:
+            from ..models.response import ErrorMessage
             parsed = loads(message)
             self.parsed_message = ErrorMessage(parsed)
         except Exception:
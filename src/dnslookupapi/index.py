@@ -0,0 +1,201 @@
+from bisect import bisect_left, bisect_right, insort
+import ipaddress
+
+from .models.response import Response, DnsCaaRecord
+
+
+def _host(value: str) -> str:
+    return value.lower().rstrip('.')
+
+
+class _IntervalIndex:
+    """
+    Domains by packed address with range lookups.
+
+    Domains are kept in sets per address. The addresses are kept in a large
+    sorted array and a small sorted buffer of new addresses, and a range
+    query is a binary search in both. Addresses left without domains stay
+    in the large array and are skipped by queries. The buffer is merged
+    into the array, and dead addresses are dropped from it, once either of
+    them grows past about sqrt(n) entries, so an update costs O(sqrt(n))
+    amortized and a query O(log n + sqrt(n) + result size).
+    """
+    _MIN_BUFFER = 32
+
+    def __init__(self):
+        self._domains = {}
+        self._keys = []
+        self._merged = set()
+        self._dead = 0
+        self._pending = []
+
+    def add(self, key: bytes, domain: str):
+        domains = self._domains.get(key)
+        if domains is None:
+            domains = self._domains[key] = set()
+            if key in self._merged:
+                self._dead -= 1
+            else:
+                insort(self._pending, key)
+                if len(self._pending) > self._limit():
+                    self._merge()
+        domains.add(domain)
+
+    def remove(self, key: bytes, domain: str):
+        domains = self._domains.get(key)
+        if domains is None:
+            return
+        domains.discard(domain)
+        if not domains:
+            del self._domains[key]
+            if key in self._merged:
+                self._dead += 1
+                if self._dead > self._limit():
+                    self._merge()
+            else:
+                del self._pending[bisect_left(self._pending, key)]
+
+    def range(self, first: bytes, last: bytes) -> set:
+        result = set()
+        for keys in (self._keys, self._pending):
+            lo = bisect_left(keys, first)
+            hi = bisect_right(keys, last, lo)
+            for i in range(lo, hi):
+                domains = self._domains.get(keys[i])
+                if domains is not None:
+                    result.update(domains)
+        return result
+
+    def _limit(self) -> int:
+        return max(_IntervalIndex._MIN_BUFFER, int(len(self._keys) ** 0.5))
+
+    def _merge(self):
+        if self._dead:
+            keys = []
+            for key in self._keys:
+                if key in self._domains:
+                    keys.append(key)
+                else:
+                    self._merged.discard(key)
+        else:
+            keys = self._keys
+        # Both parts are sorted runs, so this sort is a linear merge
+        keys.extend(self._pending)
+        keys.sort()
+        self._merged.update(self._pending)
+        self._keys = keys
+        self._dead = 0
+        self._pending = []
+
+    def __len__(self):
+        return len(self._domains)
+
+
+class ResponseIndex:
+    """
+    Reverse indexes over lookup results.
+
+    A/AAAA addresses are kept packed in sorted arrays, so addresses
+    and CIDR ranges are found with a binary search. NS, MX and CNAME targets
+    and CAA tags are kept in hash indexes. Adding a response for a domain
+    which is already indexed replaces the previous one.
+
+    The index is not thread-safe.
+    """
+
+    def __init__(self):
+        self._ips = {4: _IntervalIndex(), 6: _IntervalIndex()}
+        self._hosts = {'NS': {}, 'MX': {}, 'CNAME': {}}
+        self._caa = {}
+        self._entries = {}
+
+    def add(self, response: Response):
+        domain = response.domain_name.lower()
+        self.remove(domain)
+
+        ips = set()
+        hosts = set()
+        caa = set()
+        for record in response.dns_records:
+            if record.dns_type in ('A', 'AAAA'):
+                try:
+                    ip = ipaddress.ip_address(record.value)
+                except ValueError:
+                    continue
+                ips.add((ip.version, ip.packed))
+            elif record.dns_type in self._hosts:
+                hosts.add((record.dns_type, _host(record.value)))
+            elif isinstance(record, DnsCaaRecord):
+                caa.add((record.tag.lower(), None))
+                caa.add((record.tag.lower(), record.value.lower()))
+
+        for version, ip in ips:
+            self._ips[version].add(ip, domain)
+        for dns_type, host in hosts:
+            self._hosts[dns_type].setdefault(host, set()).add(domain)
+        for key in caa:
+            self._caa.setdefault(key, set()).add(domain)
+
+        self._entries[domain] = (ips, hosts, caa)
+
+    def remove(self, domain: str) -> bool:
+        """
+        Remove the domain from the index.
+
+        :return: True if the domain was indexed
+        """
+        domain = domain.lower()
+        entry = self._entries.pop(domain, None)
+        if entry is None:
+            return False
+
+        ips, hosts, caa = entry
+        for version, ip in ips:
+            self._ips[version].remove(ip, domain)
+        for dns_type, host in hosts:
+            ResponseIndex._discard(self._hosts[dns_type], host, domain)
+        for key in caa:
+            ResponseIndex._discard(self._caa, key, domain)
+        return True
+
+    def domains_in(self, network: str) -> set:
+        """
+        Domains with an A or AAAA record in the network.
+
+        :param network: Address or CIDR range, e.g. '192.0.2.0/24'
+        :raises ValueError: invalid network
+        """
+        net = ipaddress.ip_network(network, strict=False)
+        return self._ips[net.version].range(
+            net.network_address.packed, net.broadcast_address.packed)
+
+    def domains_by_ns(self, host: str) -> set:
+        return set(self._hosts['NS'].get(_host(host), ()))
+
+    def domains_by_mx(self, host: str) -> set:
+        return set(self._hosts['MX'].get(_host(host), ()))
+
+    def domains_by_cname(self, target: str) -> set:
+        return set(self._hosts['CNAME'].get(_host(target), ()))
+
+    def domains_by_caa(self, tag: str, value: str = None) -> set:
+        """
+        Domains with a CAA record with the tag, e.g. 'issue',
+        and optionally the value, e.g. 'letsencrypt.org'.
+        """
+        key = (tag.lower(), None if value is None else value.lower())
+        return set(self._caa.get(key, ()))
+
+    def __contains__(self, domain: str) -> bool:
+        return domain.lower() in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _discard(index: dict, key, domain: str):
+        domains = index.get(key)
+        if domains is not None:
+            domains.discard(domain)
+            if not domains:
+                del index[key]
@@ -0,0 +1,199 @@
+import os
+import struct
+import typing
+import zlib
+
+from .bulk import BulkClient, BulkResult
+from .models.response import Response
+from .exceptions.error import ResponseError, UnparsableApiResponseError, \
+    ApiAuthError, BadRequestError
+
+_FRAME = struct.Struct('<I')
+
+
+class JobStats(typing.NamedTuple):
+    completed: int
+    skipped: int
+    failed: int
+
+
+class BulkJob:
+    """
+    Resumable bulk run on top of `BulkClient`.
+
+    Parsed responses are appended to the output file as length-prefixed
+    `Response.to_bytes()` frames. Every finished domain is then appended to
+    the progress log as a line `<offset> <length> <domain>`; domains which
+    the API answered with an error are logged with offset -1 and not
+    written to the output. A job restarted with the same input skips the
+    logged domains and continues where it stopped. Lookups failed because
+    of transport, authorization or HTTP errors are not logged and are
+    retried on the next run.
+
+    The input can be split between several nodes: a job with `shards` = N
+    and `shard` = i only handles the domains with hash(domain) % N == i.
+    """
+
+    _client: BulkClient
+    _output_path: str
+    _progress_path: str
+    _shard: int
+    _shards: int
+    _fsync: bool
+
+    def __init__(self, client: BulkClient, output_path: str, **kwargs):
+        """
+        :param client: `BulkClient` used for lookups
+        :param output_path: File the responses are appended to
+        :key progress_path: str: (optional) Progress log file.
+            Defaults to `output_path` + '.progress'
+        :key shard: int: (optional) Index of the shard handled by this job
+        :key shards: int: (optional) Total number of shards
+        :key fsync: bool: (optional) fsync files after every domain
+        :key overwrite: bool: (optional) Allow to discard a non-empty
+            output file which has no progress log
+        """
+        shard = int(kwargs.get('shard', 0))
+        shards = int(kwargs.get('shards', 1))
+        if shards < 1 or not 0 <= shard < shards:
+            raise ValueError("Shard index should be in [0, shards)")
+
+        self._client = client
+        self._output_path = output_path
+        self._progress_path = kwargs.get('progress_path') \
+            or output_path + '.progress'
+        self._shard = shard
+        self._shards = shards
+        self._fsync = bool(kwargs.get('fsync', False))
+        self._overwrite = bool(kwargs.get('overwrite', False))
+        self._completed = {}
+
+    @property
+    def output_path(self) -> str:
+        return self._output_path
+
+    @property
+    def progress_path(self) -> str:
+        return self._progress_path
+
+    @property
+    def completed(self) -> dict:
+        """Logged domains mapped to their (offset, length) in the output"""
+        return self._completed
+
+    def in_shard(self, domain: str) -> bool:
+        if self._shards == 1:
+            return True
+        return zlib.crc32(domain.lower().encode('UTF-8')) \
+            % self._shards == self._shard
+
+    def run(self, domains: typing.Iterable[str],
+            rr_types: str = '_all') -> JobStats:
+        """
+        Look up every domain of the shard which is not completed yet.
+
+        :param domains: Iterable of domain names, surrounding whitespace
+            and empty lines are ignored. Domains are compared in lowercase
+        :param rr_types: Optional. String. See `Client.get`
+        :return: `JobStats` of this run
+        :raises ValueError: the output file is not empty but there is
+            no progress log, and `overwrite` is not set
+        """
+        end = self._load_progress()
+        skipped = 0
+        counts = {'completed': 0, 'failed': 0}
+
+        def pending():
+            nonlocal skipped
+            for domain in domains:
+                domain = domain.strip().lower()
+                if not domain or not self.in_shard(domain):
+                    continue
+                if domain in self._completed:
+                    skipped += 1
+                    continue
+                yield domain
+
+        with open(self._output_path, 'ab') as output, \
+                open(self._progress_path, 'a', encoding='UTF-8',
+                     newline='') as progress:
+            # Drop a frame written after the last logged domain
+            output.truncate(end)
+            output.seek(end)
+            for result in self._client.get(pending(), rr_types):
+                if self._write(result, output, progress):
+                    counts['completed'] += 1
+                else:
+                    counts['failed'] += 1
+
+        return JobStats(counts['completed'], skipped, counts['failed'])
+
+    def _write(self, result: BulkResult, output, progress) -> bool:
+        if result.error is None:
+            data = result.response.to_bytes()
+            offset = output.tell()
+            output.write(_FRAME.pack(len(data)))
+            output.write(data)
+            length = _FRAME.size + len(data)
+            self._flush(output)
+        elif BulkJob._is_final(result.error):
+            offset, length = -1, 0
+        else:
+            return False
+
+        progress.write('{} {} {}\n'.format(offset, length, result.domain))
+        self._flush(progress)
+        self._completed[result.domain] = (offset, length)
+        return True
+
+    def _flush(self, file):
+        file.flush()
+        if self._fsync:
+            os.fsync(file.fileno())
+
+    def _load_progress(self) -> int:
+        """Read the progress log, return the end of the logged output"""
+        self._completed = {}
+        end = 0
+        if not os.path.exists(self._progress_path):
+            if not self._overwrite and os.path.exists(self._output_path) \
+                    and os.path.getsize(self._output_path) > 0:
+                raise ValueError(
+                    "Output file {} is not empty and has no progress log "
+                    "{}".format(self._output_path, self._progress_path))
+            return end
+
+        with open(self._progress_path, 'r+', encoding='UTF-8',
+                  newline='') as progress:
+            valid = 0
+            for line in progress:
+                if not line.endswith('\n'):
+                    break
+                offset, length, domain = line.split(' ', 2)
+                offset, length = int(offset), int(length)
+                self._completed[domain[:-1].lower()] = (offset, length)
+                end = max(end, offset + length)
+                valid += len(line.encode('UTF-8'))
+            # Drop a partially written line
+            progress.truncate(valid)
+        return end
+
+    @staticmethod
+    def _is_final(error: Exception) -> bool:
+        if isinstance(error, (ApiAuthError, BadRequestError)):
+            return False
+        return isinstance(error, (ResponseError, UnparsableApiResponseError))
+
+    @staticmethod
+    def read_output(path: str) -> typing.Iterator[Response]:
+        """Iterate over the responses written by a job"""
+        with open(path, 'rb') as output:
+            while True:
+                header = output.read(_FRAME.size)
+                if len(header) < _FRAME.size:
+                    return
+                length, = _FRAME.unpack(header)
+                data = output.read(length)
+                if len(data) < length:
+                    return
+                yield Response.from_bytes(data)
@@ -1,5 +1,6 @@
 import copy
 from datetime import datetime
+import struct
 
 from .base import BaseModel
 import sys
@@ -57,7 +58,7 @@ def _bool_value(values: dict, key: str) -> bool:
     return False
 
 
-values_map = {1: 'address', 2: 'target', 15: 'target', 16: 'strings', 28: 'address', 257: 'value', 6: 'host'}
+values_map = {1: 'address', 2: 'target', 5: 'target', 15: 'target', 16: 'strings', 28: 'address', 257: 'value', 6: 'host'}
 classnames_map = {6: 'DnsSoaRecord', 15: 'DnsMxRecord', 257: 'DnsCaaRecord'}
 
 
@@ -83,12 +84,41 @@ class DnsRecord(BaseModel):
             self.dns_type = _string_value(values, 'dnsType')
             self.name = _string_value(values, 'name')
             self.ttl = _int_value(values, 'ttl')
-            if values_map[self.type]:
+            if self.type in values_map:
                 self.value = _string_value(values, values_map[self.type])
             if self.type == 16:
                 self.value = "".join(_list_value(values, values_map[self.type]))
             self.raw_text = _string_value(values, 'rawText')
 
+    def to_bytes(self) -> bytes:
+        """Compact binary representation, see `DnsRecord.from_bytes`"""
+        strings = _StringTable()
+        record = _pack_record(self, strings)
+        return b''.join((
+            _HEADER.pack(_MAGIC, SERIALIZATION_VERSION, _KIND_RECORD),
+            strings.pack(), record))
+
+    @staticmethod
+    def from_bytes(data: bytes) -> 'DnsRecord':
+        """
+        Restore a record encoded with `DnsRecord.to_bytes`.
+        The instance has the same class as the encoded one.
+
+        :raises ValueError: data is not an encoded record
+            or was written by an unsupported version
+        """
+        view, offset = _check_header(data, _KIND_RECORD)
+        try:
+            strings, offset = _StringTable.unpack(view, offset)
+            record, offset = _unpack_record(view, offset, strings)
+        except (struct.error, IndexError) as error:
+            raise ValueError("Corrupted data: {}".format(error))
+        _check_end(view, offset)
+        return record
+
+    def __reduce__(self):
+        return DnsRecord.from_bytes, (self.to_bytes(),)
+
 
 class DnsSoaRecord(DnsRecord):
     admin: str
@@ -173,8 +203,66 @@ class Response(BaseModel):
             self.dns_types = _string_value(values, 'dnsTypes')
             for rec in values['dnsRecords']:
                 classname = classnames_map[rec['type']] if rec['type'] in classnames_map.keys() else 'DnsRecord'
-                self.dns_records.append(_object_value(rec, classname))
-                self.records_by_type[rec['dnsType']].append(_object_value(rec, classname))
+                record = _object_value(rec, classname)
+                self.dns_records.append(record)
+                self.records_by_type[rec['dnsType']].append(record)
+
+    def to_bytes(self) -> bytes:
+        """
+        Compact binary representation, see `Response.from_bytes`.
+
+        Strings are stored once, `records_by_type` is not stored at all
+        and is rebuilt from `dns_records` on load.
+        """
+        strings = _StringTable()
+        header = [strings.index(self.domain_name),
+                  strings.index(self.dns_types),
+                  len(self.types), len(self.dns_records)]
+        types = struct.pack('<%di' % len(self.types), *self.types)
+        records = b''.join(_pack_record(r, strings) for r in self.dns_records)
+        return b''.join((
+            _HEADER.pack(_MAGIC, SERIALIZATION_VERSION, _KIND_RESPONSE),
+            strings.pack(), _RESPONSE.pack(*header), types, records))
+
+    @staticmethod
+    def from_bytes(data: bytes) -> 'Response':
+        """
+        Restore a `Response` encoded with `Response.to_bytes`.
+
+        :raises ValueError: data is not an encoded response
+            or was written by an unsupported version
+        """
+        view, offset = _check_header(data, _KIND_RESPONSE)
+        try:
+            strings, offset = _StringTable.unpack(view, offset)
+            domain_name, dns_types, types_count, records_count = \
+                _RESPONSE.unpack_from(view, offset)
+            offset += _RESPONSE.size
+            types = list(struct.unpack_from('<%di' % types_count, view, offset))
+            offset += 4 * types_count
+
+            dns_records = []
+            records_by_type = {}
+            for _ in range(records_count):
+                record, offset = _unpack_record(view, offset, strings)
+                dns_records.append(record)
+                records_by_type.setdefault(record.dns_type, []).append(record)
+
+            response = Response.__new__(Response)
+            response.__dict__.update({
+                'domain_name': strings[domain_name],
+                'types': types,
+                'dns_types': strings[dns_types],
+                'dns_records': dns_records,
+                'records_by_type': records_by_type,
+            })
+        except (struct.error, IndexError) as error:
+            raise ValueError("Corrupted data: {}".format(error))
+        _check_end(view, offset)
+        return response
+
+    def __reduce__(self):
+        return Response.from_bytes, (self.to_bytes(),)
 
 
 class ErrorMessage(BaseModel):
@@ -190,3 +278,152 @@ class ErrorMessage(BaseModel):
         if values is not None:
             self.code = _int_value(values, 'code')
             self.message = _string_value(values, 'messages')
+
+
+# Binary encoding of the models.
+#
+# header:   magic, version, kind
+# strings:  count, then (length, utf-8 bytes) for every distinct string
+# response: domain_name, dns_types, len(types), len(dns_records),
+#           types as int32, then every record
+# record:   class tag, type, dns_type, name, ttl, value, raw_text,
+#           then the fields of the subclass
+#
+# All string fields are indexes in the string table.
+
+SERIALIZATION_VERSION = 1
+
+_MAGIC = b'DL'
+_KIND_RESPONSE = 1
+_KIND_RECORD = 2
+
+_HEADER = struct.Struct('<2sBB')
+_COUNT = struct.Struct('<I')
+_RESPONSE = struct.Struct('<IIII')
+_RECORD = struct.Struct('<BiIIiII')
+_SOA = struct.Struct('<IIIIIII')
+_MX = struct.Struct('<iI')
+_CAA = struct.Struct('<iI')
+
+_TAG_RECORD = 0
+_TAG_SOA = 1
+_TAG_MX = 2
+_TAG_CAA = 3
+
+_record_tags = {DnsRecord: _TAG_RECORD, DnsSoaRecord: _TAG_SOA,
+                DnsMxRecord: _TAG_MX, DnsCaaRecord: _TAG_CAA}
+
+
+class _StringTable:
+    def __init__(self):
+        self._indexes = {}
+        self._strings = []
+
+    def index(self, value: str) -> int:
+        i = self._indexes.get(value)
+        if i is None:
+            i = self._indexes[value] = len(self._strings)
+            self._strings.append(value)
+        return i
+
+    def pack(self) -> bytes:
+        parts = [_COUNT.pack(len(self._strings))]
+        for value in self._strings:
+            encoded = value.encode('UTF-8')
+            parts.append(_COUNT.pack(len(encoded)))
+            parts.append(encoded)
+        return b''.join(parts)
+
+    @staticmethod
+    def unpack(view: memoryview, offset: int) -> tuple:
+        count, = _COUNT.unpack_from(view, offset)
+        offset += _COUNT.size
+        strings = []
+        for _ in range(count):
+            length, = _COUNT.unpack_from(view, offset)
+            offset += _COUNT.size
+            if offset + length > len(view):
+                raise ValueError("Corrupted data: string out of bounds")
+            strings.append(str(view[offset:offset + length], 'UTF-8'))
+            offset += length
+        return strings, offset
+
+
+def _check_header(data: bytes, kind: int) -> tuple:
+    view = memoryview(data)
+    try:
+        magic, version, data_kind = _HEADER.unpack_from(view, 0)
+    except struct.error:
+        raise ValueError("Data is too short")
+    if magic != _MAGIC or data_kind != kind:
+        raise ValueError("Unexpected data format")
+    if version != SERIALIZATION_VERSION:
+        raise ValueError("Unsupported serialization version: {}".format(version))
+    return view, _HEADER.size
+
+
+def _check_end(view: memoryview, offset: int):
+    if offset != len(view):
+        raise ValueError("Corrupted data: unexpected trailing bytes")
+
+
+def _pack_record(record: DnsRecord, strings: _StringTable) -> bytes:
+    tag = _record_tags[type(record)]
+    packed = _RECORD.pack(
+        tag, record.type, strings.index(record.dns_type),
+        strings.index(record.name), record.ttl,
+        strings.index(record.value), strings.index(record.raw_text))
+
+    if tag == _TAG_SOA:
+        return packed + _SOA.pack(
+            strings.index(record.admin), strings.index(record.host),
+            record.expire, record.minimum, record.refresh, record.retry,
+            record.serial)
+    if tag == _TAG_MX:
+        return packed + _MX.pack(record.priority, strings.index(record.host))
+    if tag == _TAG_CAA:
+        return packed + _CAA.pack(record.flags, strings.index(record.tag))
+    return packed
+
+
+def _unpack_record(view: memoryview, offset: int, strings: list) -> tuple:
+    tag, rtype, dns_type, name, ttl, value, raw_text = \
+        _RECORD.unpack_from(view, offset)
+    offset += _RECORD.size
+    fields = {
+        'type': rtype,
+        'dns_type': strings[dns_type],
+        'name': strings[name],
+        'ttl': ttl,
+        'value': strings[value],
+        'raw_text': strings[raw_text],
+    }
+
+    if tag == _TAG_SOA:
+        cls = DnsSoaRecord
+        admin, host, expire, minimum, refresh, retry, serial = \
+            _SOA.unpack_from(view, offset)
+        offset += _SOA.size
+        fields.update({
+            'admin': strings[admin], 'host': strings[host],
+            'expire': expire, 'minimum': minimum, 'refresh': refresh,
+            'retry': retry, 'serial': serial,
+        })
+    elif tag == _TAG_MX:
+        cls = DnsMxRecord
+        priority, host = _MX.unpack_from(view, offset)
+        offset += _MX.size
+        fields.update({'priority': priority, 'host': strings[host]})
+    elif tag == _TAG_CAA:
+        cls = DnsCaaRecord
+        flags, caa_tag = _CAA.unpack_from(view, offset)
+        offset += _CAA.size
+        fields.update({'flags': flags, 'tag': strings[caa_tag]})
+    elif tag == _TAG_RECORD:
+        cls = DnsRecord
+    else:
+        raise ValueError("Unknown record class: {}".format(tag))
+
+    record = cls.__new__(cls)
+    record.__dict__.update(fields)
+    return record, offset
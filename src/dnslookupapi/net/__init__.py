@@ -1,3 +1,26 @@
-__all__ = ['ApiRequester']
+__all__ = ['ApiRequester', 'Http2ApiRequester', 'HedgingPolicy']
 
-from .http import ApiRequester
+import sys
+
+_lazy = {
+    'ApiRequester': '.http',
+    'Http2ApiRequester': '.http2',
+    'HedgingPolicy': '.hedging',
+}
+
+if sys.version_info < (3, 7):
+    from .http import ApiRequester
+    from .http2 import Http2ApiRequester
+    from .hedging import HedgingPolicy
+else:
+    def __getattr__(name):
+        if name in _lazy:
+            from importlib import import_module
+            value = getattr(import_module(_lazy[name], __name__), name)
+            globals()[name] = value
+            return value
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name))
+
+    def __dir__():
+        return sorted(list(globals()) + __all__)
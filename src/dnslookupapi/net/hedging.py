@@ -0,0 +1,298 @@
+from collections import deque
+import heapq
+import threading
+import time
+
+_local = threading.local()
+
+
+def current_attempt() -> '_Attempt' or None:
+    """The hedged attempt running on this thread, if any"""
+    return getattr(_local, 'attempt', None)
+
+
+class _Attempt:
+    """
+    One run of a hedged function.
+
+    A transport which can abort the request of a running attempt registers
+    an abort callback with `on_cancel`; `cancel` calls it once the other
+    attempt has won. The function of a cancelled attempt is expected to
+    raise soon after. Callbacks registered after `finish` are not kept.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._callbacks = []
+        self._cancelled = False
+        self._finished = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def on_cancel(self, callback):
+        with self._lock:
+            if self._finished:
+                return
+            if not self._cancelled:
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def cancel(self):
+        with self._lock:
+            if self._finished or self._cancelled:
+                return
+            self._cancelled = True
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def finish(self):
+        with self._lock:
+            self._finished = True
+            self._callbacks = []
+
+    def run(self, function):
+        _local.attempt = self
+        try:
+            return function()
+        finally:
+            _local.attempt = None
+            self.finish()
+
+
+class _Race:
+    """Outcome of a hedged call, decided by the first successful attempt"""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.winner = None
+        self.result = None
+        self.hedge_started = False
+        self.hedge_done = False
+        self.hedge_error = None
+
+
+class _Scheduler:
+    """Runs callbacks after a delay on a single background thread"""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._queue = []
+        self._counter = 0
+        self._thread = None
+        self._stopped = False
+
+    def call_later(self, delay: float, callback):
+        with self._condition:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, daemon=True,
+                    name='dnslookupapi-hedging-timer')
+                self._thread.start()
+            self._counter += 1
+            heapq.heappush(self._queue,
+                           (time.monotonic() + delay, self._counter, callback))
+            self._condition.notify()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._queue = []
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._stopped and (
+                        not self._queue
+                        or self._queue[0][0] > time.monotonic()):
+                    timeout = self._queue[0][0] - time.monotonic() \
+                        if self._queue else None
+                    self._condition.wait(timeout)
+                if self._stopped:
+                    return
+                _, _, callback = heapq.heappop(self._queue)
+            callback()
+
+
+class HedgingPolicy:
+    """
+    Sends a duplicate of a slow API call and returns the first response.
+
+    The call runs on the calling thread. If it has not completed after
+    `delay` seconds, or after the `percentile` of recently observed
+    latencies when no fixed delay is set, it is sent once more from a pool
+    of `workers` threads, which only runs these hedged calls. The first
+    successful response wins. The losing call is aborted when the
+    transport supports it (the request's connection is closed, or the
+    HTTP/2 stream is reset); otherwise its result is discarded when it
+    completes. At most `max_extra` hedged calls per primary call are sent
+    (0.1 means up to 10% extra load).
+
+    A copy of a policy (pickle, e.g. for a `BulkClient` worker process)
+    has the same settings and fresh statistics.
+    """
+    _settings: dict
+
+    def __init__(self, **kwargs):
+        """
+        :key delay: float: (optional) Fixed hedging delay in seconds
+        :key percentile: float: (optional) Latency percentile used as the
+            delay when `delay` is not set, in (0, 100)
+        :key min_samples: int: (optional) Latencies observed before
+            percentile based hedging starts
+        :key window: int: (optional) Number of latencies kept
+        :key max_extra: float: (optional) Max ratio of hedged calls to calls
+        :key workers: int: (optional) Threads running the hedged calls
+        """
+        self._settings = {
+            'delay': kwargs.get('delay'),
+            'percentile': float(kwargs.get('percentile', 95)),
+            'min_samples': int(kwargs.get('min_samples', 20)),
+            'window': int(kwargs.get('window', 200)),
+            'max_extra': float(kwargs.get('max_extra', 0.1)),
+            'workers': int(kwargs.get('workers', 8)),
+        }
+        s = self._settings
+        if s['delay'] is not None and s['delay'] <= 0:
+            raise ValueError("Hedging delay should be positive")
+        if not 0 < s['percentile'] < 100:
+            raise ValueError("Percentile should be in (0, 100)")
+        if not 0 <= s['max_extra'] <= 1:
+            raise ValueError("Max extra load should be in [0, 1]")
+        if s['min_samples'] < 1 or s['window'] < s['min_samples'] \
+                or s['workers'] < 1:
+            raise ValueError("Invalid min_samples, window or workers")
+
+        self._latencies = deque(maxlen=s['window'])
+        self._calls = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+        self._lock = threading.Lock()
+        self._executor = None
+        self._scheduler = _Scheduler()
+
+    @property
+    def settings(self) -> dict:
+        return dict(self._settings)
+
+    @property
+    def stats(self) -> dict:
+        """Counters of calls, hedged calls and calls won by the hedge"""
+        with self._lock:
+            return {'calls': self._calls, 'hedged': self._hedged,
+                    'hedge_wins': self._hedge_wins}
+
+    def current_delay(self) -> float or None:
+        """Hedging delay in seconds, None while there is too little data"""
+        if self._settings['delay'] is not None:
+            return float(self._settings['delay'])
+        with self._lock:
+            if len(self._latencies) < self._settings['min_samples']:
+                return None
+            latencies = sorted(self._latencies)
+        i = int(self._settings['percentile'] / 100 * (len(latencies) - 1))
+        return latencies[i]
+
+    def call(self, function):
+        """Call `function()` with hedging and return its result"""
+        with self._lock:
+            self._calls += 1
+        delay = self.current_delay()
+        if delay is None:
+            return self._timed(function)
+
+        race = _Race()
+        primary, hedge = _Attempt(), _Attempt()
+        self._scheduler.call_later(
+            delay, lambda: self._start_hedge(function, race, primary, hedge))
+
+        try:
+            result = primary.run(lambda: self._timed(function))
+        except BaseException as e:
+            with race.condition:
+                if race.winner is None and race.hedge_started:
+                    # The hedge may still succeed
+                    while not race.hedge_done:
+                        race.condition.wait()
+                if race.winner is hedge:
+                    return race.result
+                # No hedge is started after the call has failed
+                race.winner = primary
+            raise e
+
+        with race.condition:
+            if race.winner is None:
+                race.winner = primary
+        if race.winner is hedge:
+            return race.result
+        hedge.cancel()
+        return result
+
+    def shutdown(self, wait_calls: bool = True):
+        self._scheduler.stop()
+        if self._executor is not None:
+            self._executor.shutdown(wait_calls)
+
+    def _start_hedge(self, function, race: _Race, primary: _Attempt,
+                     hedge: _Attempt):
+        with race.condition:
+            if race.winner is not None or not self._take_budget():
+                return
+            race.hedge_started = True
+        self._pool().submit(self._run_hedge, function, race, primary, hedge)
+
+    def _run_hedge(self, function, race: _Race, primary: _Attempt,
+                   hedge: _Attempt):
+        result, error = None, None
+        try:
+            result = hedge.run(lambda: self._timed(function))
+        except BaseException as e:
+            error = e
+        with race.condition:
+            race.hedge_done = True
+            won = error is None and race.winner is None
+            if won:
+                race.winner = hedge
+                race.result = result
+            race.condition.notify_all()
+        if won:
+            with self._lock:
+                self._hedge_wins += 1
+            primary.cancel()
+
+    def _pool(self):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    from concurrent.futures import ThreadPoolExecutor
+                    self._executor = ThreadPoolExecutor(
+                        self._settings['workers'],
+                        thread_name_prefix='dnslookupapi-hedging')
+        return self._executor
+
+    def _take_budget(self) -> bool:
+        with self._lock:
+            if self._hedged + 1 > self._settings['max_extra'] * self._calls:
+                return False
+            self._hedged += 1
+            return True
+
+    def _timed(self, function):
+        # Measured from the actual start, so that waiting for a worker
+        # does not count as latency
+        start = time.monotonic()
+        result = function()
+        with self._lock:
+            self._latencies.append(time.monotonic() - start)
+        return result
+
+    def __reduce__(self):
+        return HedgingPolicy._from_settings, (self._settings,)
+
+    @staticmethod
+    def _from_settings(settings: dict) -> 'HedgingPolicy':
+        return HedgingPolicy(**settings)
@@ -1,15 +1,79 @@
-from requests import request, Response
 from ..exceptions.error import ApiAuthError, HttpApiError, BadRequestError
 from ..version import VERSION, LIBRARY_NAME
+from functools import lru_cache
 import logging
+import socket
+import threading
+import typing
+import zlib
+
+# `requests` is imported when the first call is made, so that importing
+# and creating a client stays cheap for short-lived processes.
+if typing.TYPE_CHECKING:
+    import requests
+    from .hedging import HedgingPolicy
+
+
+class _Abort:
+    """Shuts down the socket of a connection used by a hedged attempt"""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self._lock = threading.Lock()
+        self._armed = True
+
+    def disarm(self):
+        with self._lock:
+            self._armed = False
+
+    def __call__(self):
+        with self._lock:
+            sock = getattr(self._conn, 'sock', None)
+            if not self._armed or sock is None:
+                return
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+@lru_cache(maxsize=None)
+def _abortable_pool(base: type) -> type:
+    """
+    Connection pool class which lets a hedged attempt abort its request.
+
+    The connection taken by an attempt is shut down when the attempt is
+    cancelled, until the connection is put back into the pool.
+    """
+    from .hedging import current_attempt
+
+    class _Pool(base):
+        def _get_conn(self, *args, **kwargs):
+            conn = super()._get_conn(*args, **kwargs)
+            attempt = current_attempt()
+            if attempt is not None:
+                conn.dnslookupapi_abort = _Abort(conn)
+                attempt.on_cancel(conn.dnslookupapi_abort)
+            return conn
+
+        def _put_conn(self, conn):
+            abort = getattr(conn, 'dnslookupapi_abort', None)
+            if abort is not None:
+                abort.disarm()
+                conn.dnslookupapi_abort = None
+            super()._put_conn(conn)
+
+    return _Pool
 
 
 class ApiRequester:
     __logger = logging.getLogger("api-requester")
-    __connect_timeout = 10
+    _connect_timeout = 10
     __user_agent = "{name}/{ver}".format(name=LIBRARY_NAME, ver=VERSION)
     _base_url: str
     _timeout: float
+    _session: 'requests.Session' or None
+    _hedging: 'HedgingPolicy' or None
 
     def __init__(self, **kwargs):
         """
@@ -17,14 +81,58 @@ class ApiRequester:
         :param kwargs: Supported parameters:
         - base_url: (optional) API endpoint URL; str
         - timeout: (optional) API call timeout in seconds; float
+        - pool_size: (optional) max keep-alive connections kept per host; int
+        - hedging: (optional) policy for duplicating slow GET calls;
+          HedgingPolicy
         """
         self._base_url = ''
         self.timeout = 30
+        self._pool_size = 10
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._hedging = None
 
         if 'base_url' in kwargs:
             self.base_url = kwargs['base_url']
         if 'timeout' in kwargs:
             self.timeout = kwargs['timeout']
+        if 'pool_size' in kwargs:
+            self._pool_size = int(kwargs['pool_size'])
+            if self._pool_size < 1:
+                raise ValueError("Pool size should be a positive integer")
+        if kwargs.get('hedging') is not None:
+            from .hedging import HedgingPolicy
+            if not isinstance(kwargs['hedging'], HedgingPolicy):
+                raise ValueError(
+                    "Hedging should be an instance of HedgingPolicy")
+            self._hedging = kwargs['hedging']
+
+    @property
+    def session(self) -> 'requests.Session':
+        """HTTP session with the pool of keep-alive connections"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> 'requests.Session':
+        from requests import Session
+        from requests.adapters import HTTPAdapter
+
+        session = Session()
+        adapter = HTTPAdapter(pool_connections=1,
+                              pool_maxsize=self._pool_size)
+        if self._hedging is not None:
+            from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+
+            adapter.poolmanager.pool_classes_by_scheme = {
+                'http': _abortable_pool(HTTPConnectionPool),
+                'https': _abortable_pool(HTTPSConnectionPool),
+            }
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
 
     @property
     def base_url(self) -> str:
@@ -49,43 +157,123 @@ class ApiRequester:
         else:
             raise ValueError("Timeout value should be in [1, 60]")
 
+    def close(self):
+        """Release pooled connections"""
+        if self._session is not None:
+            self._session.close()
+
+    @property
+    def hedging(self) -> 'HedgingPolicy' or None:
+        return self._hedging
+
     def get(self, payload: dict) -> str:
-        headers = {
-            'User-Agent': ApiRequester.__user_agent,
-            'Connection': 'close'
-        }
-        response = request(
-            "GET",
-            self.base_url,
-            params=payload,
-            headers=headers,
-            timeout=(ApiRequester.__connect_timeout, self.timeout)
-        )
+        if self._hedging is not None:
+            return self._hedging.call(lambda: self._get(payload))
+        return self._get(payload)
+
+    def _get(self, payload: dict) -> str:
+        response = self._request('GET', params=payload,
+                                 headers=self._headers())
 
         return ApiRequester._handle_response(response)
 
     def post(self, data: dict) -> str:
-        headers = {
-            'User-Agent': ApiRequester.__user_agent,
-            'Connection': 'close'
-        }
+        headers = self._headers()
         if 'apiKey' in data:
             headers['X-Authentication-Token'] = data.pop('apiKey')
 
-        response = request(
-            'POST',
+        response = self._request('POST', json=data, headers=headers)
+
+        return ApiRequester._handle_response(response)
+
+    def get_stream(self, payload: dict, sink=None, compressed: bool = False,
+                   chunk_size: int = 65536) -> bytes or int:
+        """
+        GET the response body as bytes without decoding it to str.
+
+        gzip or deflate transfer encoding is negotiated with the server.
+
+        :param payload: Request parameters
+        :param sink: (optional) File-like object with a `write` method,
+            or a callable, the body is written to in chunks.
+        :param compressed: Return the body gzip compressed; a gzip body is
+            passed through as received, other bodies are compressed on the fly
+        :param chunk_size: Size of the chunks read from the connection
+        :return: The body if `sink` is None, the number of bytes written
+            otherwise
+        """
+        headers = self._headers()
+        headers['Accept-Encoding'] = 'gzip, deflate'
+        with self._stream('GET', params=payload, headers=headers) as response:
+            ApiRequester._check_status(response)
+            chunks = self._iter_body(response, compressed, chunk_size)
+
+            if sink is None:
+                return b''.join(chunks)
+
+            write = sink if callable(sink) else sink.write
+            written = 0
+            for chunk in chunks:
+                write(chunk)
+                written += len(chunk)
+            return written
+
+    def _iter_body(self, response, compressed: bool, chunk_size: int):
+        if not compressed:
+            yield from self._iter_content(response, chunk_size, True)
+            return
+
+        encoding = response.headers.get('Content-Encoding', '').lower()
+        if encoding == 'gzip':
+            yield from self._iter_content(response, chunk_size, False)
+            return
+
+        compressor = zlib.compressobj(wbits=31)
+        for chunk in self._iter_content(response, chunk_size, True):
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.flush()
+
+    # Transport hooks, overridden by other transports
+
+    def _headers(self) -> dict:
+        return {'User-Agent': ApiRequester.__user_agent}
+
+    def _request(self, method: str, **kwargs) -> 'requests.Response':
+        return self.session.request(
+            method,
             self.base_url,
-            json=data,
-            headers=headers,
-            timeout=(ApiRequester.__connect_timeout, self.timeout)
+            timeout=(ApiRequester._connect_timeout, self.timeout),
+            **kwargs
         )
 
-        return ApiRequester._handle_response(response)
+    def _stream(self, method: str, **kwargs) -> 'requests.Response':
+        """Context manager of a response with the body not read yet"""
+        return self.session.request(
+            method,
+            self.base_url,
+            timeout=(ApiRequester._connect_timeout, self.timeout),
+            stream=True,
+            **kwargs
+        )
+
+    @staticmethod
+    def _iter_content(response: 'requests.Response', chunk_size: int,
+                      decode: bool):
+        if decode:
+            return response.iter_content(chunk_size)
+        return response.raw.stream(chunk_size, decode_content=False)
+
+    @staticmethod
+    def _handle_response(response: 'requests.Response') -> str:
+        ApiRequester._check_status(response)
+        return response.content.decode('UTF-8')
 
     @staticmethod
-    def _handle_response(response: Response) -> str:
+    def _check_status(response: 'requests.Response'):
         if 200 <= response.status_code < 300:
-            return response.content.decode('UTF-8')
+            return
 
         if response.status_code in [401, 402, 403]:
             raise ApiAuthError(response.text)
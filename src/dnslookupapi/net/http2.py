@@ -0,0 +1,161 @@
+import asyncio
+from contextlib import contextmanager
+import threading
+import typing
+
+from .hedging import current_attempt
+from .http import ApiRequester
+
+# httpx is an optional dependency: pip install dns-lookup-api[http2]
+if typing.TYPE_CHECKING:
+    import httpx
+
+_END = object()
+
+
+@contextmanager
+def _transport_errors():
+    # Connection errors and timeouts are raised as OSErrors, like the ones
+    # of `requests`, so that callers handle both transports the same way
+    import httpx
+    try:
+        yield
+    except httpx.TimeoutException as e:
+        raise TimeoutError(str(e)) from e
+    except httpx.TransportError as e:
+        raise ConnectionError(str(e)) from e
+
+
+async def _next_chunk(iterator):
+    try:
+        return await iterator.__anext__()
+    except StopAsyncIteration:
+        return _END
+
+
+class _StreamedResponse:
+    """Response with the body not read yet, read from a calling thread"""
+
+    def __init__(self, response: 'httpx.Response', loop):
+        self._response = response
+        self._loop = loop
+        self.status_code = response.status_code
+        self.headers = response.headers
+
+    @property
+    def text(self) -> str:
+        return self._response.text
+
+    def iter_chunks(self, chunk_size: int, decode: bool):
+        if decode:
+            iterator = self._response.aiter_bytes(chunk_size)
+        else:
+            iterator = self._response.aiter_raw(chunk_size)
+        while True:
+            chunk = asyncio.run_coroutine_threadsafe(
+                _next_chunk(iterator), self._loop).result()
+            if chunk is _END:
+                return
+            yield chunk
+
+
+class Http2ApiRequester(ApiRequester):
+    """
+    `ApiRequester` which multiplexes concurrent calls over HTTP/2.
+
+    Calls made from many threads share a few connections, each carrying
+    many concurrent streams, instead of taking a connection per call.
+    A new connection is opened only when the server's limit of concurrent
+    streams is reached, up to `pool_size` connections. The connections are
+    served by an event loop on a background thread, the calling threads
+    wait for their responses.
+
+    https URLs negotiate HTTP/2 with ALPN and fall back to HTTP/1.1 when
+    the server does not support it; http URLs use HTTP/2 without
+    negotiation (h2c with prior knowledge).
+
+    Requires `httpx` with HTTP/2 support.
+    """
+    _loop: asyncio.AbstractEventLoop or None
+
+    def __init__(self, **kwargs):
+        """
+        :param kwargs: See `ApiRequester`
+        :raises ImportError: httpx or h2 are not installed
+        """
+        import httpx  # noqa: F401
+        import h2  # noqa: F401
+
+        super().__init__(**kwargs)
+        self._loop = None
+
+    def close(self):
+        """Close the connections and stop the event loop"""
+        with self._session_lock:
+            if self._session is None:
+                return
+            asyncio.run_coroutine_threadsafe(
+                self._session.aclose(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._session = None
+            self._loop = None
+
+    def _create_session(self) -> 'httpx.AsyncClient':
+        import httpx
+
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True,
+                         name='dnslookupapi-http2').start()
+        return httpx.AsyncClient(
+            http1=not self.base_url.startswith('http://'),
+            http2=True,
+            limits=httpx.Limits(max_connections=self._pool_size,
+                                max_keepalive_connections=self._pool_size))
+
+    def _run(self, coroutine):
+        session = self.session
+        future = asyncio.run_coroutine_threadsafe(
+            coroutine(session), self._loop)
+        attempt = current_attempt()
+        if attempt is not None:
+            # A hedged attempt which lost resets its stream
+            attempt.on_cancel(future.cancel)
+        return future.result()
+
+    def _timeouts(self) -> 'httpx.Timeout':
+        import httpx
+
+        return httpx.Timeout(self.timeout,
+                             connect=ApiRequester._connect_timeout)
+
+    def _request(self, method: str, **kwargs) -> 'httpx.Response':
+        timeout = self._timeouts()
+        with _transport_errors():
+            return self._run(lambda session: session.request(
+                method, self.base_url, timeout=timeout, **kwargs))
+
+    @contextmanager
+    def _stream(self, method: str, **kwargs) -> _StreamedResponse:
+        timeout = self._timeouts()
+
+        async def send(session):
+            request = session.build_request(
+                method, self.base_url, timeout=timeout, **kwargs)
+            response = await session.send(request, stream=True)
+            if not 200 <= response.status_code < 300:
+                # The error mapping needs the body
+                await response.aread()
+            return response
+
+        with _transport_errors():
+            response = self._run(send)
+            try:
+                yield _StreamedResponse(response, self._loop)
+            finally:
+                asyncio.run_coroutine_threadsafe(
+                    response.aclose(), self._loop).result()
+
+    @staticmethod
+    def _iter_content(response: _StreamedResponse, chunk_size: int,
+                      decode: bool):
+        return response.iter_chunks(chunk_size, decode)
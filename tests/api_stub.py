@@ -0,0 +1,226 @@
+import asyncio
+import gzip
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from json import dumps
+from urllib.parse import urlparse, parse_qs
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+    import h2.exceptions
+except ImportError:
+    h2 = None
+
+API_KEY = 'at_' + '0' * 29
+
+
+def dns_data(domain: str) -> dict:
+    return {
+        'domainName': domain, 'types': [1], 'dnsTypes': 'A',
+        'dnsRecords': [{
+            'type': 1, 'dnsType': 'A', 'name': domain + '.',
+            'ttl': 300, 'address': '192.0.2.1',
+            'rawText': domain + '.\t\t300\tIN\tA\t192.0.2.1'}]}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        status, headers, body = self.server.stub.respond(
+            self.path, self.headers.get('Accept-Encoding', ''))
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(socketserver.ThreadingMixIn, HTTPServer):
+    # http.server.ThreadingHTTPServer is only available since Python 3.7
+    daemon_threads = True
+
+
+class ApiStub:
+    """
+    Local stand-in for the API, answers every lookup with one A record.
+
+    Domains starting with 'missing' get an error message instead, 'denied'
+    an auth error, 'broken' a response without the root element and
+    'empty' a response with no records and 'unavailable' HTTP 503.
+    Bodies are gzip compressed when `gzip` is set and the client accepts it.
+    `H2Server(stub.respond)` serves the same responses over HTTP/2.
+    """
+    def __init__(self):
+        self.requests = []
+        self.delay = None
+        self.gzip = True
+        self._server = _Server(('127.0.0.1', 0), _Handler)
+        self._server.stub = self
+        self.url = 'http://127.0.0.1:{}/DNSService'.format(
+            self._server.server_address[1])
+
+    def start(self) -> 'ApiStub':
+        threading.Thread(target=self._server.serve_forever,
+                         daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def respond(self, path: str, accept_encoding: str) -> tuple:
+        domain = parse_qs(urlparse(path).query)['domainName'][0]
+        self.requests.append(domain)
+        if self.delay:
+            self.delay(domain)
+        if domain.startswith('unavailable'):
+            return self._response(503, b'Service unavailable', '')
+        if domain.startswith('missing'):
+            parsed = {'ErrorMessage': {'msg': 'Unable to retrieve dns record'}}
+        elif domain.startswith('denied'):
+            parsed = {'ErrorMessage': {'errorCode': 'API_KEY_05',
+                                       'msg': 'Access restricted'}}
+        elif domain.startswith('broken'):
+            parsed = {'DNSData': {}}
+        elif domain.startswith('empty'):
+            parsed = {'DNSData': dict(dns_data(domain), dnsRecords=[])}
+        else:
+            parsed = {'DNSData': dns_data(domain)}
+        return self._response(200, dumps(parsed).encode('UTF-8'),
+                              accept_encoding)
+
+    def _response(self, status: int, body: bytes,
+                  accept_encoding: str) -> tuple:
+        headers = [('Content-Type', 'application/json')]
+        if self.gzip and 'gzip' in accept_encoding:
+            body = gzip.compress(body)
+            headers.append(('Content-Encoding', 'gzip'))
+        headers.append(('Content-Length', str(len(body))))
+        return status, headers, body
+
+
+class H2Server:
+    """
+    Minimal HTTP/2 server without TLS (h2c with prior knowledge).
+
+    `respond(path, accept_encoding)` returns (status, headers, body) for a
+    GET request and runs on the event loop; every response is sent `delay`
+    seconds later, without blocking other streams. `connections` counts
+    the accepted connections. Requires h2.
+    """
+    def __init__(self, respond, delay: float = 0.0, port: int = 0):
+        self.connections = 0
+        self._respond = respond
+        self._delay = delay
+        self._loop = asyncio.new_event_loop()
+        self._server = self._loop.run_until_complete(self._loop.create_server(
+            self._protocol, '127.0.0.1', port))
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    def _protocol(self) -> '_H2Protocol':
+        self.connections += 1
+        return _H2Protocol(self._respond, self._delay)
+
+    def serve_forever(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def start(self) -> 'H2Server':
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._loop.call_soon_threadsafe(self._server.close)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+class _H2Protocol(asyncio.Protocol):
+    def __init__(self, respond, delay: float):
+        self._respond = respond
+        self._delay = delay
+        self._conn = h2.connection.H2Connection(h2.config.H2Configuration(
+            client_side=False, header_encoding='UTF-8'))
+        self._transport = None
+        self._window_waiters = {}
+
+    def connection_made(self, transport):
+        self._transport = transport
+        self._conn.initiate_connection()
+        self._flush()
+
+    def data_received(self, data: bytes):
+        try:
+            events = self._conn.receive_data(data)
+        except h2.exceptions.ProtocolError:
+            self._flush()
+            self._transport.close()
+            return
+        for event in events:
+            if isinstance(event, h2.events.RequestReceived):
+                asyncio.ensure_future(
+                    self._handle(event.stream_id, dict(event.headers)))
+            elif isinstance(event, h2.events.DataReceived):
+                self._conn.acknowledge_received_data(
+                    event.flow_controlled_length, event.stream_id)
+            elif isinstance(event, h2.events.WindowUpdated):
+                self._wake(event.stream_id)
+            elif isinstance(event, h2.events.StreamReset):
+                self._wake(event.stream_id)
+        self._flush()
+
+    def connection_lost(self, exc):
+        self._wake(0)
+
+    async def _handle(self, stream_id: int, headers: dict):
+        status, response_headers, body = self._respond(
+            headers[':path'], headers.get('accept-encoding', ''))
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        try:
+            await self._send(stream_id, status, response_headers, body)
+        except h2.exceptions.StreamClosedError:
+            pass
+
+    async def _send(self, stream_id: int, status: int,
+                    response_headers: list, body: bytes):
+        if self._transport.is_closing():
+            return
+        self._conn.send_headers(stream_id, [(':status', str(status))] + [
+            (name.lower(), value) for name, value in response_headers])
+        while body:
+            window = min(self._conn.local_flow_control_window(stream_id),
+                         self._conn.max_outbound_frame_size)
+            if window <= 0:
+                waiter = asyncio.get_event_loop().create_future()
+                self._window_waiters.setdefault(stream_id, []).append(waiter)
+                await waiter
+                if self._transport.is_closing():
+                    return
+                continue
+            self._conn.send_data(stream_id, body[:window])
+            body = body[window:]
+            self._flush()
+        self._conn.end_stream(stream_id)
+        self._flush()
+
+    def _wake(self, stream_id: int):
+        if stream_id == 0:
+            waiters = [w for ws in self._window_waiters.values() for w in ws]
+            self._window_waiters.clear()
+        else:
+            waiters = self._window_waiters.pop(stream_id, [])
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _flush(self):
+        data = self._conn.data_to_send()
+        if data and not self._transport.is_closing():
+            self._transport.write(data)
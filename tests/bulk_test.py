@@ -0,0 +1,48 @@
+import unittest
+
+from dnslookupapi import BulkClient, Response, ResponseError
+from tests.api_stub import ApiStub, API_KEY
+
+
+class TestBulkClient(unittest.TestCase):
+    """
+    Bulk lookups against a local stand-in server.
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.stub = ApiStub().start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.stub.stop()
+
+    def _check(self, client: BulkClient):
+        domains = ['domain{}.com'.format(i) for i in range(10)]
+        domains.append('missing.com')
+        results = list(client.get(domains, 'A'))
+
+        self.assertEqual([r.domain for r in results], domains)
+        for result in results[:-1]:
+            self.assertIsNone(result.error)
+            self.assertIsInstance(result.response, Response)
+            self.assertEqual(result.response.domain_name, result.domain)
+        self.assertIsNone(results[-1].response)
+        self.assertIsInstance(results[-1].error, ResponseError)
+
+    def test_threads(self):
+        self._check(BulkClient(API_KEY, base_url=self.stub.url,
+                               processes=0, threads=4, chunk_size=3))
+
+    def test_processes(self):
+        self._check(BulkClient(API_KEY, base_url=self.stub.url,
+                               processes=2, threads=2, chunk_size=3))
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            BulkClient(API_KEY, processes=-1)
+        with self.assertRaises(ValueError):
+            BulkClient(API_KEY, chunk_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
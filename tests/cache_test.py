@@ -0,0 +1,176 @@
+import threading
+import unittest
+
+from dnslookupapi import Client, ResponseError, UnparsableApiResponseError, \
+    ApiAuthError, HttpApiError
+from dnslookupapi.cache import ResponseCache, Refresher
+from tests.api_stub import ApiStub, API_KEY
+
+
+class _Clock:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_expiration(self):
+        clock = _Clock()
+        cache = ResponseCache(10, clock=clock)
+        cache.put('a', 1)
+        clock.time = 9.9
+        self.assertEqual(cache.get('a').value, 1)
+        clock.time = 10
+        self.assertIsNone(cache.get('a'))
+
+    def test_eviction(self):
+        cache = ResponseCache(10, max_size=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(len(cache), 2)
+
+    def test_refresher_once_per_key(self):
+        refresher = Refresher(1)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def refresh():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+
+        self.assertTrue(refresher.schedule('a', refresh))
+        started.wait(5)
+        self.assertFalse(refresher.schedule('a', refresh))
+        release.set()
+        refresher.shutdown()
+        self.assertEqual(len(calls), 1)
+        self.assertFalse(refresher.is_refreshing('a'))
+
+
+class TestClientCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.stub = ApiStub().start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.stub.stop()
+
+    def setUp(self) -> None:
+        self.stub.requests.clear()
+
+    def test_cache_hit(self):
+        client = Client(API_KEY, base_url=self.stub.url, cache_ttl=60)
+        first = client.get('cached.com', 'A')
+        self.assertIs(client.get('CACHED.com', 'A'), first)
+        self.assertIs(client.last_result, first)
+        client.get('cached.com', 'MX')
+        self.assertEqual(self.stub.requests, ['cached.com', 'cached.com'])
+        client.close()
+
+    def test_refresh_ahead(self):
+        clock = _Clock()
+        client = Client(API_KEY, base_url=self.stub.url, cache_ttl=10,
+                        refresh_ahead=0.5)
+        client._cache = ResponseCache(10, clock=clock)
+
+        first = client.get('refresh.com', 'A')
+        clock.time = 4
+        self.assertIs(client.get('refresh.com', 'A'), first)
+        self.assertEqual(len(self.stub.requests), 1)
+
+        clock.time = 6
+        self.assertIs(client.get('refresh.com', 'A'), first)
+        client._refresher.shutdown()
+        self.assertEqual(len(self.stub.requests), 2)
+
+        entry = client.cache.get(('refresh.com', 'A'))
+        self.assertIsNot(entry.value, first)
+        self.assertEqual(entry.stored_at, 6)
+
+    def test_negative_cache(self):
+        client = Client(API_KEY, base_url=self.stub.url, negative_cache_ttl={
+            ResponseError: 30,
+            UnparsableApiResponseError: 10,
+            Client.EMPTY_RESULT: 20,
+        })
+        for _ in range(2):
+            with self.assertRaises(ResponseError):
+                client.get('missing.com', 'A')
+            with self.assertRaises(UnparsableApiResponseError):
+                client.get('broken.com', 'A')
+            self.assertEqual(client.get('empty.com', 'A').dns_records, [])
+            with self.assertRaises(ApiAuthError):
+                client.get('denied.com', 'A')
+            client.get('found.com', 'A')
+
+        self.assertEqual(self.stub.requests, [
+            'missing.com', 'broken.com', 'empty.com', 'denied.com',
+            'found.com', 'denied.com', 'found.com'])
+        self.assertEqual(client.negative_cache_stats, {
+            'stored': 3,
+            'hits': {'ResponseError': 1, 'UnparsableApiResponseError': 1,
+                     Client.EMPTY_RESULT: 1}})
+
+        clock = _Clock()
+        client._negative_cache = ResponseCache(30, clock=clock)
+        client.get('empty.com', 'A')
+        clock.time = 20
+        client.get('empty.com', 'A')
+        self.assertEqual(self.stub.requests[-2:], ['empty.com', 'empty.com'])
+
+    def test_negative_cache_hit_raises_fresh_error(self):
+        client = Client(API_KEY, base_url=self.stub.url,
+                        negative_cache_ttl={ResponseError: 30})
+        errors = []
+        for _ in range(50):
+            try:
+                client.get('missing.com', 'A')
+            except ResponseError as e:
+                errors.append(e)
+
+        self.assertEqual(self.stub.requests, ['missing.com'])
+        self.assertEqual(len({id(e) for e in errors}), 50)
+        self.assertEqual(errors[-1].message, errors[0].message)
+        depth = 0
+        traceback = errors[-1].__traceback__
+        while traceback is not None:
+            depth += 1
+            traceback = traceback.tb_next
+        self.assertLessEqual(depth, 2)
+
+    def test_negative_cache_with_cache(self):
+        client = Client(API_KEY, base_url=self.stub.url, cache_ttl=60,
+                        negative_cache_ttl={ResponseError: 30})
+        client.get('empty.com', 'A')
+        client.get('empty.com', 'A')
+        with self.assertRaises(ResponseError):
+            client.get('missing.com', 'A')
+        with self.assertRaises(ResponseError):
+            client.get('missing.com', 'A')
+        self.assertEqual(self.stub.requests, ['empty.com', 'missing.com'])
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            Client(API_KEY, negative_cache_ttl={ApiAuthError: 10})
+        with self.assertRaises(ValueError):
+            Client(API_KEY, negative_cache_ttl={HttpApiError: 10})
+        with self.assertRaises(ValueError):
+            Client(API_KEY, negative_cache_ttl={ResponseError: 0})
+        with self.assertRaises(ValueError):
+            Client(API_KEY, refresh_ahead=0.5)
+        with self.assertRaises(ValueError):
+            Client(API_KEY, cache_ttl=10, refresh_ahead=1)
+        with self.assertRaises(ValueError):
+            Client(API_KEY, cache_ttl=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
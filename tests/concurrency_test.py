@@ -0,0 +1,82 @@
+import unittest
+
+from dnslookupapi import AimdLimiter, BulkClient
+from tests.api_stub import ApiStub, API_KEY
+
+
+def _run(limiter: AimdLimiter, latency: float, overload: bool = False):
+    """Complete one window of lookups while keeping the limit saturated"""
+    window = limiter.settings['window']
+    started = 0
+    for _ in range(window):
+        while started < window and limiter.in_flight < limiter.limit:
+            limiter.acquire()
+            started += 1
+        limiter.release(latency, overload)
+
+
+class TestAimdLimiter(unittest.TestCase):
+    def test_increase(self):
+        limiter = AimdLimiter(initial_limit=2, max_limit=4, window=5)
+        _run(limiter, 0.1)
+        self.assertEqual(limiter.limit, 3)
+        for _ in range(5):
+            _run(limiter, 0.1)
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual([d.reason for d in limiter.decisions],
+                         ['increase', 'increase'])
+
+    def test_decrease_on_errors(self):
+        limiter = AimdLimiter(initial_limit=8, window=5)
+        _run(limiter, 0.1, overload=True)
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.decisions[-1].reason, 'errors')
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_decrease_on_latency(self):
+        limiter = AimdLimiter(initial_limit=8, window=8)
+        _run(limiter, 0.1)
+        _run(limiter, 0.5)
+        self.assertEqual(limiter.decisions[-1].reason, 'latency')
+        self.assertEqual(limiter.limit, 4)
+
+    def test_min_limit(self):
+        limiter = AimdLimiter(initial_limit=2, min_limit=2, window=2)
+        _run(limiter, 0.1, overload=True)
+        self.assertEqual(limiter.limit, 2)
+        self.assertEqual(limiter.decisions, [])
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            AimdLimiter(initial_limit=10, max_limit=5)
+        with self.assertRaises(ValueError):
+            AimdLimiter(backoff=1)
+
+
+class TestBulkLimiter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.stub = ApiStub().start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.stub.stop()
+
+    def test_bulk_with_limiter(self):
+        limiter = AimdLimiter(initial_limit=1, max_limit=4, window=4)
+        client = BulkClient(API_KEY, base_url=self.stub.url, processes=0,
+                            limiter=limiter)
+        domains = ['domain{}.com'.format(i) for i in range(40)]
+        results = list(client.get(domains, 'A'))
+        self.assertEqual([r.domain for r in results], domains)
+        self.assertTrue(all(r.error is None for r in results))
+        self.assertGreater(limiter.limit, 1)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_limiter_requires_threads(self):
+        with self.assertRaises(ValueError):
+            BulkClient(API_KEY, processes=2, limiter=AimdLimiter())
+
+
+if __name__ == '__main__':
+    unittest.main()
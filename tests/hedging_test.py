@@ -0,0 +1,117 @@
+import threading
+import time
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+
+from dnslookupapi import Client, HedgingPolicy
+from dnslookupapi.net.hedging import current_attempt
+from tests.api_stub import ApiStub, API_KEY
+
+
+class TestHedging(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.stub = ApiStub().start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.stub.delay = None
+        cls.stub.stop()
+
+    def setUp(self) -> None:
+        self.stub.requests.clear()
+        self.seen = set()
+        self.lock = threading.Lock()
+        self.stub.delay = self._slow_first
+
+    def _slow_first(self, domain: str):
+        # The first request for a slow domain stalls
+        with self.lock:
+            first = domain not in self.seen
+            self.seen.add(domain)
+        if first and domain.startswith('slow'):
+            time.sleep(1.5)
+
+    def test_hedge_wins(self):
+        policy = HedgingPolicy(delay=0.1, max_extra=1)
+        client = Client(API_KEY, base_url=self.stub.url, hedging=policy)
+        start = time.monotonic()
+        response = client.get('slow.com', 'A')
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(response.domain_name, 'slow.com')
+        self.assertEqual(self.stub.requests, ['slow.com', 'slow.com'])
+        self.assertEqual(policy.stats,
+                         {'calls': 1, 'hedged': 1, 'hedge_wins': 1})
+        policy.shutdown()
+
+    def test_extra_load_cap(self):
+        policy = HedgingPolicy(delay=0.1, max_extra=0.5)
+        client = Client(API_KEY, base_url=self.stub.url, hedging=policy)
+        client.get('slow1.com', 'A')
+        client.get('slow2.com', 'A')
+        # Only one hedge is allowed for two calls
+        self.assertEqual(policy.stats['hedged'], 1)
+        self.assertEqual(len(self.stub.requests), 3)
+        policy.shutdown()
+
+    def test_percentile_delay(self):
+        policy = HedgingPolicy(percentile=50, min_samples=3, window=3)
+        self.assertIsNone(policy.current_delay())
+        client = Client(API_KEY, base_url=self.stub.url, hedging=policy)
+        for i in range(3):
+            client.get('fast{}.com'.format(i), 'A')
+        self.assertIsNotNone(policy.current_delay())
+        self.assertEqual(policy.stats['hedged'], 0)
+        policy.shutdown()
+
+    def test_concurrency_is_not_limited_by_workers(self):
+        policy = HedgingPolicy(delay=5, workers=2)
+        threads = []
+
+        def call():
+            threads.append(threading.current_thread())
+            time.sleep(0.3)
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(16) as executor:
+            callers = list(executor.map(
+                lambda _: (policy.call(call), threading.current_thread())[1],
+                range(16)))
+        self.assertLess(time.monotonic() - start, 1.0)
+        # The calls run on the calling threads
+        self.assertEqual(set(threads), set(callers))
+        policy.shutdown()
+
+    def test_loser_is_cancelled(self):
+        policy = HedgingPolicy(delay=0.1, max_extra=1)
+        cancelled = []
+        done = threading.Event()
+
+        def call():
+            if threading.current_thread().name.startswith(
+                    'dnslookupapi-hedging'):
+                return 'hedge'
+            # The primary stalls until it is cancelled
+            current_attempt().on_cancel(lambda: cancelled.append(1) or done.set())
+            done.wait(5)
+            raise ConnectionError('aborted')
+
+        start = time.monotonic()
+        self.assertEqual(policy.call(call), 'hedge')
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(len(cancelled), 1)
+        self.assertEqual(policy.stats['hedge_wins'], 1)
+        policy.shutdown()
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            HedgingPolicy(delay=0)
+        with self.assertRaises(ValueError):
+            HedgingPolicy(max_extra=2)
+        with self.assertRaises(ValueError):
+            Client(API_KEY, hedging=0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import gzip
+import socket
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from dnslookupapi import Client, Http2ApiRequester, ResponseError, \
+    ApiAuthError, HttpApiError
+from tests.api_stub import ApiStub, H2Server, API_KEY
+
+try:
+    import httpx  # noqa: F401
+    import h2
+except ImportError:
+    httpx = h2 = None
+
+
+@unittest.skipIf(h2 is None, "httpx and h2 are not installed")
+class TestHttp2Transport(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.stub = ApiStub().start()
+        cls.server = H2Server(cls.stub.respond).start()
+        cls.url = 'http://127.0.0.1:{}/DNSService'.format(cls.server.port)
+        cls.client = Client(API_KEY, base_url=cls.url, transport='http2')
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.client.close()
+        cls.server.stop()
+        cls.stub.stop()
+
+    def test_get(self):
+        self.assertIsInstance(self.client.api_requester, Http2ApiRequester)
+        response = self.client.get('h2.com', 'A')
+        self.assertEqual(response.domain_name, 'h2.com')
+        self.assertEqual(response.dns_records[0].value, '192.0.2.1')
+
+    def test_error_mapping(self):
+        with self.assertRaises(ResponseError):
+            self.client.get('missing.com', 'A')
+        with self.assertRaises(ApiAuthError):
+            self.client.get('denied.com', 'A')
+        with self.assertRaises(HttpApiError):
+            self.client.get('unavailable.com', 'A')
+        with self.assertRaises(HttpApiError):
+            self.client.get_raw_bytes('unavailable.com', 'A')
+
+    def test_raw_bytes(self):
+        plain = self.client.get_raw_bytes('h2.com', 'A')
+        self.assertEqual(plain.decode('UTF-8'),
+                         self.client.get_raw('h2.com', 'A'))
+        body = self.client.get_raw_bytes('h2.com', 'A', compressed=True)
+        self.assertEqual(gzip.decompress(body), plain)
+
+    def test_concurrent_calls_share_a_connection(self):
+        self.client.get('h2.com', 'A')
+        connections = self.server.connections
+        domains = ['d{}.com'.format(i) for i in range(50)]
+        with ThreadPoolExecutor(16) as executor:
+            responses = list(executor.map(
+                lambda d: self.client.get(d, 'A'), domains))
+        self.assertEqual([r.domain_name for r in responses], domains)
+        self.assertEqual(self.server.connections, connections)
+
+    def test_connection_error(self):
+        with socket.socket() as s:
+            s.bind(('127.0.0.1', 0))
+            port = s.getsockname()[1]
+        client = Client(API_KEY, transport='http2',
+                        base_url='http://127.0.0.1:{}/x'.format(port))
+        with self.assertRaises(ConnectionError):
+            client.get('h2.com', 'A')
+        client.close()
+
+
+class TestTransportOption(unittest.TestCase):
+    def test_invalid_transport(self):
+        with self.assertRaises(ValueError):
+            Client(API_KEY, transport='spdy')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+import unittest
+
+import dnslookupapi
+import dnslookupapi.net
+
+
+class TestLazyImport(unittest.TestCase):
+    def test_all_names_resolve(self):
+        for name in dnslookupapi.__all__:
+            self.assertIsNotNone(getattr(dnslookupapi, name), name)
+        for name in dnslookupapi.net.__all__:
+            self.assertIsNotNone(getattr(dnslookupapi.net, name), name)
+
+    def test_unknown_name(self):
+        with self.assertRaises(AttributeError):
+            dnslookupapi.NoSuchName
+
+    @unittest.skipIf(sys.version_info < (3, 7), "Imports are eager")
+    def test_import_does_not_load_transport(self):
+        code = ('import sys, dnslookupapi\n'
+                'dnslookupapi.Client\n'
+                'print(any(m == "requests" or m.startswith("requests.")\n'
+                '          for m in sys.modules))\n')
+        out = subprocess.check_output(
+            [sys.executable, '-c', code], cwd=dnslookupapi.__path__[0] + '/..')
+        self.assertEqual(out.strip(), b'False')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+
+from dnslookupapi import Response, ResponseIndex
+
+
+def _response(domain: str, *records) -> Response:
+    dns_records = []
+    for dns_type, rtype, extra in records:
+        record = {'type': rtype, 'dnsType': dns_type, 'name': domain + '.',
+                  'ttl': 300, 'rawText': ''}
+        record.update(extra)
+        dns_records.append(record)
+    return Response({'domainName': domain, 'types': [-1], 'dnsTypes': '_all',
+                     'dnsRecords': dns_records})
+
+
+class TestResponseIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = ResponseIndex()
+        self.index.add(_response(
+            'a.com',
+            ('A', 1, {'address': '192.0.2.10'}),
+            ('AAAA', 28, {'address': '2001:db8:0:0:0:0:0:1'}),
+            ('NS', 2, {'target': 'NS1.Example.net.'}),
+            ('MX', 15, {'target': 'mx.example.net.', 'priority': 10}),
+            ('CAA', 257, {'flags': 0, 'tag': 'issue',
+                          'value': 'letsencrypt.org'})))
+        self.index.add(_response(
+            'b.com',
+            ('A', 1, {'address': '192.0.2.200'}),
+            ('A', 1, {'address': '198.51.100.1'}),
+            ('CNAME', 5, {'target': 'edge.cdn.net.'}),
+            ('NS', 2, {'target': 'ns1.example.net.'})))
+
+    def test_ip_ranges(self):
+        self.assertEqual(self.index.domains_in('192.0.2.0/24'),
+                         {'a.com', 'b.com'})
+        self.assertEqual(self.index.domains_in('192.0.2.128/25'), {'b.com'})
+        self.assertEqual(self.index.domains_in('198.51.100.1'), {'b.com'})
+        self.assertEqual(self.index.domains_in('2001:db8::/32'), {'a.com'})
+        self.assertEqual(self.index.domains_in('10.0.0.0/8'), set())
+
+    def test_hosts(self):
+        self.assertEqual(self.index.domains_by_ns('ns1.example.net'),
+                         {'a.com', 'b.com'})
+        self.assertEqual(self.index.domains_by_mx('MX.example.net.'),
+                         {'a.com'})
+        self.assertEqual(self.index.domains_by_cname('edge.cdn.net'),
+                         {'b.com'})
+        self.assertEqual(self.index.domains_by_caa('issue'), {'a.com'})
+        self.assertEqual(
+            self.index.domains_by_caa('issue', 'letsencrypt.org'), {'a.com'})
+        self.assertEqual(self.index.domains_by_caa('issue', 'pki.goog'), set())
+
+    def test_update_and_remove(self):
+        self.index.add(_response('b.com', ('A', 1, {'address': '10.0.0.1'})))
+        self.assertEqual(self.index.domains_in('192.0.2.0/24'), {'a.com'})
+        self.assertEqual(self.index.domains_in('10.0.0.0/8'), {'b.com'})
+        self.assertEqual(self.index.domains_by_ns('ns1.example.net'),
+                         {'a.com'})
+
+        self.assertTrue(self.index.remove('A.com'))
+        self.assertFalse(self.index.remove('a.com'))
+        self.assertNotIn('a.com', self.index)
+        self.assertEqual(len(self.index), 1)
+        self.assertEqual(self.index.domains_by_ns('ns1.example.net'), set())
+        self.assertEqual(self.index.domains_in('2001:db8::/32'), set())
+
+    def test_readd_between_queries(self):
+        a = _response('c.com', ('A', 1, {'address': '192.0.2.10'}))
+        self.index.remove('a.com')
+        self.index.add(a)
+        self.index.remove('c.com')
+        self.assertEqual(self.index.domains_in('192.0.2.10'), set())
+        self.index.add(a)
+        self.index.add(a)
+        self.assertEqual(self.index.domains_in('192.0.2.0/24'),
+                         {'b.com', 'c.com'})
+
+    def test_many_updates_and_queries(self):
+        index = ResponseIndex()
+        expected = {}
+        for i in range(2000):
+            domain = 'd{}.com'.format(i)
+            address = '10.0.{}.{}'.format(i % 8, i % 251)
+            index.add(_response(domain, ('A', 1, {'address': address})))
+            expected[domain] = address
+            if i % 3 == 0:
+                removed = 'd{}.com'.format(i // 2)
+                if index.remove(removed):
+                    del expected[removed]
+            if i % 50 == 0:
+                network = '10.0.{}.0/24'.format(i % 8)
+                self.assertEqual(
+                    index.domains_in(network),
+                    {d for d, a in expected.items()
+                     if a.startswith('10.0.{}.'.format(i % 8))})
+        self.assertEqual(index.domains_in('10.0.0.0/16'), set(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
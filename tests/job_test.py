@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+
+from dnslookupapi import BulkClient, BulkJob
+from tests.api_stub import ApiStub, API_KEY
+
+
+class TestBulkJob(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.stub = ApiStub().start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.stub.stop()
+
+    def setUp(self) -> None:
+        self.stub.requests.clear()
+        self.dir = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.dir.name, 'out.bin')
+        self.client = BulkClient(API_KEY, base_url=self.stub.url,
+                                 processes=0, threads=2, chunk_size=4)
+        self.domains = ['domain{}.com\n'.format(i) for i in range(10)]
+        self.domains.append('missing.com\n')
+
+    def tearDown(self) -> None:
+        self.dir.cleanup()
+
+    def test_resume(self):
+        stats = BulkJob(self.client, self.output).run(self.domains[:5], 'A')
+        self.assertEqual(tuple(stats), (5, 0, 0))
+
+        # Crash after the output frame was written but not logged
+        with open(self.output, 'ab') as output:
+            output.write(b'\x10\x00\x00\x00partial')
+        with open(self.output + '.progress', 'a') as progress:
+            progress.write('123 45 dom')
+
+        self.stub.requests.clear()
+        job = BulkJob(self.client, self.output)
+        stats = job.run(self.domains, 'A')
+        self.assertEqual(tuple(stats), (6, 5, 0))
+        self.assertEqual(len(self.stub.requests), 6)
+        self.assertEqual(job.completed['missing.com'], (-1, 0))
+
+        names = [r.domain_name for r in BulkJob.read_output(self.output)]
+        self.assertEqual(names, [d.strip() for d in self.domains[:-1]])
+
+    def test_domain_case(self):
+        job = BulkJob(self.client, self.output)
+        job.run(['a.com'], 'A')
+        self.stub.requests.clear()
+        stats = BulkJob(self.client, self.output).run(['A.com', 'B.COM'], 'A')
+        self.assertEqual(tuple(stats), (1, 1, 0))
+        self.assertEqual(self.stub.requests, ['b.com'])
+
+    def test_existing_output(self):
+        with open(self.output, 'wb') as output:
+            output.write(b'\x00' * 1000)
+        with self.assertRaises(ValueError):
+            BulkJob(self.client, self.output).run(self.domains, 'A')
+        self.assertEqual(os.path.getsize(self.output), 1000)
+
+        BulkJob(self.client, self.output, overwrite=True).run(['a.com'], 'A')
+        self.assertEqual(
+            [r.domain_name for r in BulkJob.read_output(self.output)],
+            ['a.com'])
+
+    def test_shards(self):
+        handled = []
+        for shard in range(3):
+            output = '{}.{}'.format(self.output, shard)
+            job = BulkJob(self.client, output, shard=shard, shards=3)
+            job.run(self.domains, 'A')
+            handled.extend(job.completed)
+        self.assertEqual(sorted(handled),
+                         sorted(d.strip() for d in self.domains))
+
+    def test_invalid_shard(self):
+        with self.assertRaises(ValueError):
+            BulkJob(self.client, self.output, shard=2, shards=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
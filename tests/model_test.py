@@ -1,6 +1,7 @@
+import pickle
 import unittest
 from json import loads
-from dnslookupapi import Response, ErrorMessage
+from dnslookupapi import Response, ErrorMessage, DnsRecord, DnsSoaRecord
 
 
 _json_response_empty = '''{'ErrorMessage': {'msg': 'Unable to retrieve dns record for adakjhdqkjwdh.com'}}'''
@@ -165,6 +166,45 @@ class TestModel(unittest.TestCase):
         self.assertEqual(parsed.dns_records[7]['serial'],
                          response['dnsRecords'][7]['serial'])
 
+    def test_serialization(self):
+        parsed = Response(loads(_json_response_ok)['DNSData'])
+        restored = Response.from_bytes(parsed.to_bytes())
+        self.assertEqual(restored, parsed)
+        self.assertEqual(str(restored), str(parsed))
+        self.assertEqual(
+            [type(r) for r in restored.dns_records],
+            [type(r) for r in parsed.dns_records])
+        self.assertIs(restored.records_by_type['SOA'][0],
+                      restored.dns_records[7])
+
+    def test_pickle(self):
+        parsed = Response(loads(_json_response_ok)['DNSData'])
+        restored = pickle.loads(pickle.dumps(parsed))
+        self.assertEqual(restored, parsed)
+        self.assertLess(len(pickle.dumps(parsed)),
+                        len(pickle.dumps(parsed.__dict__)))
+
+        soa = pickle.loads(pickle.dumps(parsed.dns_records[7]))
+        self.assertIsInstance(soa, DnsSoaRecord)
+        self.assertEqual(soa, parsed.dns_records[7])
+
+    def test_serialization_errors(self):
+        parsed = Response(loads(_json_response_ok)['DNSData'])
+        with self.assertRaises(ValueError):
+            DnsRecord.from_bytes(parsed.to_bytes())
+        with self.assertRaises(ValueError):
+            Response.from_bytes(b'DL')
+        with self.assertRaises(ValueError):
+            Response.from_bytes(b'DL\xff\x01')
+
+        data = parsed.to_bytes()
+        for truncated in (data[:10], data[:-3], data + b'\x00'):
+            with self.assertRaises(ValueError):
+                Response.from_bytes(truncated)
+        record = parsed.dns_records[7].to_bytes()
+        with self.assertRaises(ValueError):
+            DnsRecord.from_bytes(record[:-1])
+
     def test_error_parsing(self):
         error = loads(_json_response_error)
         parsed_error = ErrorMessage(error)
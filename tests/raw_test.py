@@ -0,0 +1,56 @@
+import gzip
+import io
+import unittest
+from json import loads
+
+from dnslookupapi import Client, HttpApiError
+from tests.api_stub import ApiStub, API_KEY
+
+
+class TestRawBytes(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.stub = ApiStub().start()
+        cls.client = Client(API_KEY, base_url=cls.stub.url)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.stub.stop()
+
+    def tearDown(self) -> None:
+        self.stub.gzip = True
+
+    def test_bytes(self):
+        body = self.client.get_raw_bytes('raw.com', 'A')
+        self.assertIsInstance(body, bytes)
+        self.assertEqual(loads(body)['DNSData']['domainName'], 'raw.com')
+        self.assertEqual(body.decode('UTF-8'),
+                         self.client.get_raw('raw.com', 'A'))
+
+    def test_sink(self):
+        sink = io.BytesIO()
+        written = self.client.get_raw_bytes('raw.com', 'A', sink=sink)
+        self.assertEqual(written, len(sink.getvalue()))
+        self.assertEqual(sink.getvalue(),
+                         self.client.get_raw_bytes('raw.com', 'A'))
+
+        chunks = []
+        self.client.get_raw_bytes('raw.com', 'A', sink=chunks.append)
+        self.assertEqual(b''.join(chunks), sink.getvalue())
+
+    def test_compressed(self):
+        plain = self.client.get_raw_bytes('raw.com', 'A')
+        for server_gzip in (True, False):
+            self.stub.gzip = server_gzip
+            body = self.client.get_raw_bytes('raw.com', 'A', compressed=True)
+            self.assertEqual(gzip.decompress(body), plain)
+
+    def test_http_error(self):
+        with self.assertRaises(HttpApiError):
+            self.client.get_raw_bytes('unavailable.com', 'A')
+        with self.assertRaises(HttpApiError):
+            self.client.get_raw('unavailable.com', 'A')
+
+
+if __name__ == '__main__':
+    unittest.main()